@@ -1,5 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Value
+from django.db.models.functions import Concat
 from .models import CustomUser, FrontDeskStaff, Doctor, DoctorSchedule
 
 
@@ -7,7 +9,7 @@ from .models import CustomUser, FrontDeskStaff, Doctor, DoctorSchedule
 class CustomUserAdmin(UserAdmin):
     list_display = ['username', 'email', 'user_type', 'is_active_user', 'date_joined']
     list_filter = ['user_type', 'is_active_user', 'is_staff']
-    search_fields = ['username', 'email', 'first_name', 'last_name']
+    search_fields = ['^username', '^email', '^first_name', '^last_name']
     
     fieldsets = UserAdmin.fieldsets + (
         ('Additional Info', {'fields': ('user_type', 'phone_number', 'is_active_user')}),
@@ -21,11 +23,20 @@ class CustomUserAdmin(UserAdmin):
 class FrontDeskStaffAdmin(admin.ModelAdmin):
     list_display = ['employee_id', 'get_full_name', 'shift', 'department', 'date_joined']
     list_filter = ['shift', 'department']
-    search_fields = ['employee_id', 'user__first_name', 'user__last_name']
-    
+    list_select_related = ('user',)
+    search_fields = ['^employee_id', '^user__first_name', '^user__last_name']
+
+    def get_queryset(self, request):
+        # Compute the full name in the database so the changelist can
+        # render and sort it without per-row user lookups
+        return super().get_queryset(request).select_related('user').annotate(
+            full_name_annot=Concat('user__first_name', Value(' '), 'user__last_name')
+        )
+
     def get_full_name(self, obj):
-        return obj.user.get_full_name()
+        return obj.full_name_annot
     get_full_name.short_description = 'Full Name'
+    get_full_name.admin_order_field = 'full_name_annot'
 
 
 class DoctorScheduleInline(admin.TabularInline):
@@ -38,9 +49,27 @@ class DoctorAdmin(admin.ModelAdmin):
     list_display = ['doctor_id', 'full_name', 'specialization', 'clinic_location', 
                     'is_available', 'phone_number']
     list_filter = ['specialization', 'clinic_location', 'is_available', 'gender']
-    search_fields = ['doctor_id', 'full_name', 'specialization', 'email']
+    search_fields = ['^doctor_id', '^full_name', '^specialization', '^email']
+    list_select_related = ('user',)
     readonly_fields = ['created_at', 'updated_at']
     inlines = [DoctorScheduleInline]
+
+    def get_search_results(self, request, queryset, search_term):
+        # On Postgres (production) use full-text search across the doctor
+        # fields instead of the default per-field LIKE pipeline
+        from django.db import connection
+
+        if search_term and connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+
+            vector = SearchVector(
+                'full_name', 'specialization', 'doctor_id', 'email'
+            )
+            queryset = queryset.annotate(search=vector).filter(
+                search=SearchQuery(search_term)
+            )
+            return queryset, False
+        return super().get_search_results(request, queryset, search_term)
     
     fieldsets = (
         ('Basic Information', {
@@ -66,4 +95,5 @@ class DoctorAdmin(admin.ModelAdmin):
 class DoctorScheduleAdmin(admin.ModelAdmin):
     list_display = ['doctor', 'day_of_week', 'start_time', 'end_time', 'slot_duration', 'is_active']
     list_filter = ['day_of_week', 'is_active']
+    list_select_related = ('doctor',)
     search_fields = ['doctor__full_name']
\ No newline at end of file
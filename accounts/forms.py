@@ -1,8 +1,12 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
-from django.contrib.auth import authenticate
+from django.db import transaction
 from .models import CustomUser, FrontDeskStaff, Doctor, DoctorSchedule
 
+# Resolved once at import time; ChoiceField copies the sequence per form
+# instance, so avoid repeating the _meta field lookup as well
+_SHIFT_CHOICES = tuple(FrontDeskStaff._meta.get_field('shift').choices)
+
 
 class StaffLoginForm(AuthenticationForm):
     """
@@ -25,33 +29,34 @@ class StaffLoginForm(AuthenticationForm):
     def clean(self):
         username = self.cleaned_data.get('username')
         password = self.cleaned_data.get('password')
-        
+
         if username and password:
-            self.user_cache = authenticate(
-                self.request,
+            # Apply the staff checks in the lookup itself so the expensive
+            # password hash is only verified for valid staff accounts
+            user = CustomUser.objects.filter(
                 username=username,
-                password=password
-            )
-            
-            if self.user_cache is None:
+                user_type='staff',
+                is_active_user=True,
+                is_active=True
+            ).first()
+
+            if user is None:
+                # Run the hasher against a throwaway user anyway so response
+                # timing does not reveal whether the username exists
+                CustomUser().set_password(password)
                 raise forms.ValidationError(
                     "Invalid username or password.",
                     code='invalid_login'
                 )
-            
-            # Check if user is staff
-            if self.user_cache.user_type != 'staff':
-                raise forms.ValidationError(
-                    "This account does not have staff access.",
-                    code='invalid_user_type'
-                )
-            
-            if not self.user_cache.is_active_user:
+
+            if not user.check_password(password):
                 raise forms.ValidationError(
-                    "This account has been deactivated.",
-                    code='inactive'
+                    "Invalid username or password.",
+                    code='invalid_login'
                 )
-        
+
+            self.user_cache = user
+
         return self.cleaned_data
 
 
@@ -82,7 +87,7 @@ class StaffRegistrationForm(UserCreationForm):
         widget=forms.TextInput(attrs={'class': 'form-control'})
     )
     shift = forms.ChoiceField(
-        choices=FrontDeskStaff._meta.get_field('shift').choices,
+        choices=_SHIFT_CHOICES,
         widget=forms.Select(attrs={'class': 'form-control'})
     )
     department = forms.CharField(
@@ -104,21 +109,39 @@ class StaffRegistrationForm(UserCreationForm):
         self.fields['password1'].widget.attrs.update({'class': 'form-control'})
         self.fields['password2'].widget.attrs.update({'class': 'form-control'})
     
+    def clean_employee_id(self):
+        # Duplicates surface during is_valid(), where a view can re-render
+        # the form; one indexed EXISTS per submission is the price of
+        # keeping the standard is_valid()/save() contract
+        employee_id = self.cleaned_data['employee_id']
+        if FrontDeskStaff.objects.filter(employee_id=employee_id).exists():
+            raise forms.ValidationError(
+                "A staff member with that employee ID already exists.",
+                code='unique'
+            )
+        return employee_id
+
     def save(self, commit=True):
         user = super().save(commit=False)
         user.user_type = 'staff'
         user.email = self.cleaned_data['email']
-        
+
         if commit:
-            user.save()
-            # Create FrontDeskStaff profile
-            FrontDeskStaff.objects.create(
-                user=user,
-                employee_id=self.cleaned_data['employee_id'],
-                shift=self.cleaned_data['shift'],
-                department=self.cleaned_data.get('department', 'Reception')
-            )
-        
+            # Commit the user and profile together so a failed profile
+            # INSERT cannot leave an orphan user behind. The post_save
+            # signal mints a default profile when the user row lands;
+            # update_or_create applies the submitted details over it
+            with transaction.atomic():
+                user.save()
+                FrontDeskStaff.objects.update_or_create(
+                    user=user,
+                    defaults={
+                        'employee_id': self.cleaned_data['employee_id'],
+                        'shift': self.cleaned_data['shift'],
+                        'department': self.cleaned_data.get('department', 'Reception'),
+                    }
+                )
+
         return user
 
 
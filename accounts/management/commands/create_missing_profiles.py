@@ -6,32 +6,28 @@ class Command(BaseCommand):
 
     def handle(self, *args, **kwargs):
         self.stdout.write(self.style.WARNING('Checking for users without profiles...'))
-        
-        # Fix staff users
-        staff_users = CustomUser.objects.filter(user_type='staff')
-        staff_fixed = 0
-        
-        for user in staff_users:
-            if not FrontDeskStaff.objects.filter(user=user).exists():
-                staff_count = FrontDeskStaff.objects.count()
-                employee_id = f'EMP{staff_count + 1:04d}'
-                
-                FrontDeskStaff.objects.create(
-                    user=user,
-                    employee_id=employee_id,
-                    shift='morning',
-                    department='Reception'
-                )
-                self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created profile for staff user: {user.username} ({employee_id})')
-                )
-                staff_fixed += 1
-            else:
-                self.stdout.write(
-                    self.style.SUCCESS(f'✓ {user.username} already has profile')
-                )
-        
+
+        staff_users = list(
+            CustomUser.objects.filter(user_type='staff').only('id', 'username')
+        )
+
+        # The manager helper diffs against existing profiles, continues the
+        # employee_id sequence from the current maximum and writes one
+        # batched INSERT
+        new_profiles = FrontDeskStaff.objects.bulk_create_for(staff_users)
+        created_ids = {profile.user_id for profile in new_profiles}
+
+        lines = [
+            self.style.SUCCESS(f'✅ Created profile for staff user: {profile.user.username} ({profile.employee_id})')
+            for profile in new_profiles
+        ]
+        lines.extend(
+            self.style.SUCCESS(f'✓ {user.username} already has profile')
+            for user in staff_users if user.id not in created_ids
+        )
+
         # Summary
-        self.stdout.write(self.style.SUCCESS(f'\n=== Summary ==='))
-        self.stdout.write(self.style.SUCCESS(f'Staff profiles created: {staff_fixed}'))
-        self.stdout.write(self.style.SUCCESS(f'Total staff users: {staff_users.count()}'))
\ No newline at end of file
+        lines.append(self.style.SUCCESS(f'\n=== Summary ==='))
+        lines.append(self.style.SUCCESS(f'Staff profiles created: {len(new_profiles)}'))
+        lines.append(self.style.SUCCESS(f'Total staff users: {len(staff_users)}'))
+        self.stdout.write('\n'.join(lines))
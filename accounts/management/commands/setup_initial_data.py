@@ -2,13 +2,24 @@
 
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
 from accounts.models import CustomUser, FrontDeskStaff, Doctor, DoctorSchedule
 from frontdesk.models import Patient, DoctorAvailability
 from datetime import date, time, timedelta
+from itertools import product
 import random
 
 User = get_user_model()
 
+# Seed fields copied verbatim from each patients_data entry
+PATIENT_FIELDS = (
+    'first_name', 'last_name', 'date_of_birth', 'gender', 'blood_group',
+    'phone_number', 'email', 'address_line1', 'city', 'state', 'pincode',
+    'emergency_contact_name', 'emergency_contact_phone',
+    'emergency_contact_relation', 'allergies', 'chronic_conditions',
+)
+
 
 class Command(BaseCommand):
     help = 'Set up initial data for Allo Health system'
@@ -21,42 +32,69 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        # The seed data reuses a few sample passwords; hash each distinct
+        # one once instead of running the hasher per user
+        self._password_cache = {}
+
         if options['clear']:
             self.stdout.write('Clearing existing data...')
             self.clear_data()
 
         self.stdout.write('Setting up initial data...')
-        
-        # Create superuser if it doesn't exist
-        self.create_superuser()
-        
-        # Create front desk staff
-        self.create_frontdesk_staff()
-        
-        # Create doctors
-        self.create_doctors()
-        
-        # Create patients
-        self.create_patients()
-        
-        # Create doctor schedules
-        self.create_doctor_schedules()
-        
-        # Create doctor availability
-        self.create_doctor_availability()
+
+        # Commit all the seed INSERTs once instead of per row
+        with transaction.atomic():
+            # Create superuser if it doesn't exist
+            self.create_superuser()
+
+            # Create front desk staff
+            self.create_frontdesk_staff()
+
+            # Create doctors
+            self.create_doctors()
+
+            # Create patients
+            self.create_patients()
+
+            # Create doctor schedules
+            self.create_doctor_schedules()
+
+            # Create doctor availability
+            self.create_doctor_availability()
         
         self.stdout.write(
             self.style.SUCCESS('Successfully set up initial data!')
         )
 
+    def hashed_password(self, raw_password):
+        """Return the cached hash for a sample password"""
+        if raw_password not in self._password_cache:
+            self._password_cache[raw_password] = make_password(raw_password)
+        return self._password_cache[raw_password]
+
     def clear_data(self):
-        """Clear existing data"""
-        DoctorAvailability.objects.all().delete()
-        DoctorSchedule.objects.all().delete()
-        Patient.objects.all().delete()
-        Doctor.objects.all().delete()
-        FrontDeskStaff.objects.all().delete()
-        User.objects.filter(is_superuser=False).delete()
+        """Clear existing data in a single transaction"""
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # TRUNCATE skips Django's cascade collector and per-row
+                # signal dispatch entirely
+                tables = ', '.join(
+                    model._meta.db_table for model in (
+                        DoctorAvailability, DoctorSchedule, Patient,
+                        Doctor, FrontDeskStaff
+                    )
+                )
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'TRUNCATE {tables} RESTART IDENTITY CASCADE'
+                    )
+            else:
+                DoctorAvailability.objects.all().delete()
+                DoctorSchedule.objects.all().delete()
+                Patient.objects.all().delete()
+                Doctor.objects.all().delete()
+                FrontDeskStaff.objects.all().delete()
+            User.objects.filter(is_superuser=False).delete()
 
     def create_superuser(self):
         """Create superuser if it doesn't exist"""
@@ -79,7 +117,7 @@ class Command(BaseCommand):
                 'password': 'staff123',
                 'first_name': 'Sarah',
                 'last_name': 'Johnson',
-                'employee_id': 'EMP001',
+                'employee_id': 'EMP0001',
                 'shift': 'morning',
                 'department': 'Reception'
             },
@@ -89,7 +127,7 @@ class Command(BaseCommand):
                 'password': 'staff123',
                 'first_name': 'Michael',
                 'last_name': 'Chen',
-                'employee_id': 'EMP002',
+                'employee_id': 'EMP0002',
                 'shift': 'afternoon',
                 'department': 'Reception'
             },
@@ -99,36 +137,52 @@ class Command(BaseCommand):
                 'password': 'staff123',
                 'first_name': 'Emily',
                 'last_name': 'Davis',
-                'employee_id': 'EMP003',
+                'employee_id': 'EMP0003',
                 'shift': 'night',
                 'department': 'Reception'
             }
         ]
 
+        # Fetch existing usernames once, then insert the missing users and
+        # their profiles in one bulk_create each instead of per-row queries
+        existing = set(
+            User.objects.filter(
+                username__in=[d['username'] for d in staff_data]
+            ).values_list('username', flat=True)
+        )
+
+        new_users = []
         for data in staff_data:
-            user, created = User.objects.get_or_create(
+            if data['username'] in existing:
+                continue
+            user = User(
                 username=data['username'],
-                defaults={
-                    'email': data['email'],
-                    'first_name': data['first_name'],
-                    'last_name': data['last_name'],
-                    'user_type': 'staff',
-                    'is_staff': True,
-                    'is_active': True
-                }
+                email=data['email'],
+                first_name=data['first_name'],
+                last_name=data['last_name'],
+                user_type='staff',
+                is_staff=True,
+                is_active=True
             )
-            
-            if created:
-                user.set_password(data['password'])
-                user.save()
-                
-                FrontDeskStaff.objects.create(
-                    user=user,
-                    employee_id=data['employee_id'],
-                    shift=data['shift'],
-                    department=data['department']
-                )
-                self.stdout.write(f'Created staff: {data["username"]}/staff123')
+            user.password = self.hashed_password(data['password'])
+            new_users.append((user, data))
+
+        User.objects.bulk_create([user for user, data in new_users])
+        FrontDeskStaff.objects.bulk_create([
+            FrontDeskStaff(
+                user=user,
+                employee_id=data['employee_id'],
+                shift=data['shift'],
+                department=data['department']
+            )
+            for user, data in new_users
+        ], ignore_conflicts=True)
+
+        if new_users:
+            self.stdout.write('\n'.join(
+                f'Created staff: {data["username"]}/staff123'
+                for user, data in new_users
+            ))
 
     def create_doctors(self):
         """Create doctor users and profiles"""
@@ -225,39 +279,53 @@ class Command(BaseCommand):
             }
         ]
 
+        existing = set(
+            User.objects.filter(
+                username__in=[d['username'] for d in doctors_data]
+            ).values_list('username', flat=True)
+        )
+
+        new_users = []
         for data in doctors_data:
-            user, created = User.objects.get_or_create(
+            if data['username'] in existing:
+                continue
+            user = User(
                 username=data['username'],
-                defaults={
-                    'email': data['email'],
-                    'first_name': data['first_name'],
-                    'last_name': data['last_name'],
-                    'user_type': 'doctor',
-                    'is_staff': True,
-                    'is_active': True
-                }
+                email=data['email'],
+                first_name=data['first_name'],
+                last_name=data['last_name'],
+                user_type='doctor',
+                is_staff=True,
+                is_active=True
             )
-            
-            if created:
-                user.set_password(data['password'])
-                user.save()
-                
-                Doctor.objects.create(
-                    user=user,
-                    doctor_id=data['doctor_id'],
-                    full_name=data['full_name'],
-                    specialization=data['specialization'],
-                    gender=data['gender'],
-                    phone_number=data['phone_number'],
-                    email=data['email'],
-                    clinic_location=data['clinic_location'],
-                    consultation_fee=data['consultation_fee'],
-                    license_number=data['license_number'],
-                    years_of_experience=data['years_of_experience'],
-                    qualifications=data['qualifications'],
-                    bio=data['bio']
-                )
-                self.stdout.write(f'Created doctor: {data["username"]}/doctor123')
+            user.password = self.hashed_password(data['password'])
+            new_users.append((user, data))
+
+        User.objects.bulk_create([user for user, data in new_users])
+        Doctor.objects.bulk_create([
+            Doctor(
+                user=user,
+                doctor_id=data['doctor_id'],
+                full_name=data['full_name'],
+                specialization=data['specialization'],
+                gender=data['gender'],
+                phone_number=data['phone_number'],
+                email=data['email'],
+                clinic_location=data['clinic_location'],
+                consultation_fee=data['consultation_fee'],
+                license_number=data['license_number'],
+                years_of_experience=data['years_of_experience'],
+                qualifications=data['qualifications'],
+                bio=data['bio']
+            )
+            for user, data in new_users
+        ], ignore_conflicts=True)
+
+        if new_users:
+            self.stdout.write('\n'.join(
+                f'Created doctor: {data["username"]}/doctor123'
+                for user, data in new_users
+            ))
 
     def create_patients(self):
         """Create sample patients"""
@@ -361,101 +429,96 @@ class Command(BaseCommand):
 
         # Get a front desk staff member to assign as registered_by
         staff = FrontDeskStaff.objects.first()
-        
-        for data in patients_data:
-            patient, created = Patient.objects.get_or_create(
+
+        existing = set(
+            Patient.objects.filter(
+                patient_id__in=[d['patient_id'] for d in patients_data]
+            ).values_list('patient_id', flat=True)
+        )
+
+        new_patients = [
+            Patient(
                 patient_id=data['patient_id'],
-                defaults={
-                    'first_name': data['first_name'],
-                    'last_name': data['last_name'],
-                    'date_of_birth': data['date_of_birth'],
-                    'gender': data['gender'],
-                    'blood_group': data['blood_group'],
-                    'phone_number': data['phone_number'],
-                    'email': data['email'],
-                    'address_line1': data['address_line1'],
-                    'city': data['city'],
-                    'state': data['state'],
-                    'pincode': data['pincode'],
-                    'emergency_contact_name': data['emergency_contact_name'],
-                    'emergency_contact_phone': data['emergency_contact_phone'],
-                    'emergency_contact_relation': data['emergency_contact_relation'],
-                    'allergies': data['allergies'],
-                    'chronic_conditions': data['chronic_conditions'],
-                    'registered_by': staff
-                }
+                registered_by=staff,
+                # bulk_create skips save(), which normally maintains the
+                # denormalized name column
+                full_name=f"{data['first_name']} {data['last_name']}",
+                **{field: data[field] for field in PATIENT_FIELDS}
             )
-            
-            if created:
-                self.stdout.write(f'Created patient: {data["patient_id"]} - {data["first_name"]} {data["last_name"]}')
+            for data in patients_data if data['patient_id'] not in existing
+        ]
+        Patient.objects.bulk_create(new_patients, batch_size=500, ignore_conflicts=True)
+
+        if new_patients:
+            self.stdout.write('\n'.join(
+                f'Created patient: {patient.patient_id} - {patient.first_name} {patient.last_name}'
+                for patient in new_patients
+            ))
 
     def create_doctor_schedules(self):
         """Create weekly schedules for doctors"""
-        doctors = Doctor.objects.all()
-        
-        for doctor in doctors:
-            # Create schedule for Monday to Friday
-            for day in range(0, 5):  # Monday to Friday
-                DoctorSchedule.objects.get_or_create(
-                    doctor=doctor,
-                    day_of_week=day,
-                    defaults={
-                        'start_time': time(9, 0),  # 9:00 AM
-                        'end_time': time(17, 0),   # 5:00 PM
-                        'slot_duration': 30,
-                        'is_active': True
-                    }
-                )
-            
-            # Create Saturday schedule (half day)
-            DoctorSchedule.objects.get_or_create(
-                doctor=doctor,
-                day_of_week=5,  # Saturday
-                defaults={
-                    'start_time': time(9, 0),  # 9:00 AM
-                    'end_time': time(13, 0),   # 1:00 PM
-                    'slot_duration': 30,
-                    'is_active': True
-                }
+        # Only the FK column is needed, so skip hydrating full Doctor rows
+        doctor_ids = list(Doctor.objects.values_list('id', flat=True))
+
+        existing = set(
+            DoctorSchedule.objects.values_list('doctor_id', 'day_of_week')
+        )
+
+        # Monday to Friday (full day) plus Saturday (half day)
+        days = [(day, time(9, 0), time(17, 0)) for day in range(0, 5)]
+        days.append((5, time(9, 0), time(13, 0)))
+
+        new_schedules = [
+            DoctorSchedule(
+                doctor_id=doctor_id,
+                day_of_week=day,
+                start_time=start,
+                end_time=end,
+                slot_duration=30,
+                is_active=True
             )
-        
+            for doctor_id, (day, start, end) in product(doctor_ids, days)
+            if (doctor_id, day) not in existing
+        ]
+
+        DoctorSchedule.objects.bulk_create(
+            new_schedules, batch_size=500, ignore_conflicts=True
+        )
+
         self.stdout.write('Created doctor schedules')
 
     def create_doctor_availability(self):
         """Create availability slots for the next 30 days"""
-        doctors = Doctor.objects.all()
+        doctor_ids = list(Doctor.objects.values_list('id', flat=True))
         today = date.today()
-        
-        for doctor in doctors:
-            for i in range(30):  # Next 30 days
-                current_date = today + timedelta(days=i)
-                
-                # Skip Sundays
-                if current_date.weekday() == 6:
-                    continue
-                
-                # Create morning slot
-                DoctorAvailability.objects.get_or_create(
-                    doctor=doctor,
-                    date=current_date,
-                    start_time=time(9, 0),
-                    end_time=time(12, 0),
-                    defaults={
-                        'is_available': True,
-                        'max_appointments': 6
-                    }
-                )
-                
-                # Create afternoon slot
-                DoctorAvailability.objects.get_or_create(
-                    doctor=doctor,
-                    date=current_date,
-                    start_time=time(14, 0),
-                    end_time=time(17, 0),
-                    defaults={
-                        'is_available': True,
-                        'max_appointments': 6
-                    }
-                )
-        
+
+        existing = set(
+            DoctorAvailability.objects.values_list('doctor_id', 'date', 'start_time')
+        )
+
+        # Next 30 days excluding Sundays, with morning and afternoon slots
+        weekday = today.weekday()
+        dates = [
+            today + timedelta(days=i) for i in range(30)
+            if (weekday + i) % 7 != 6
+        ]
+        slots = ((time(9, 0), time(12, 0)), (time(14, 0), time(17, 0)))
+
+        new_slots = [
+            DoctorAvailability(
+                doctor_id=doctor_id,
+                date=current_date,
+                start_time=start,
+                end_time=end,
+                is_available=True,
+                max_appointments=6
+            )
+            for doctor_id, current_date, (start, end) in product(doctor_ids, dates, slots)
+            if (doctor_id, current_date, start) not in existing
+        ]
+
+        DoctorAvailability.objects.bulk_create(
+            new_slots, batch_size=500, ignore_conflicts=True
+        )
+
         self.stdout.write('Created doctor availability slots')
@@ -0,0 +1,24 @@
+# accounts/middleware.py
+
+from django.utils.functional import SimpleLazyObject
+
+
+class AccountsContextMiddleware:
+    """
+    Computes the staff check once per request and stashes it on the
+    request, so the many user_passes_test/test_func call sites share one
+    answer instead of re-deriving it. Must sit after
+    AuthenticationMiddleware so request.user is populated.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # Lazy so views that never check it don't force the session lookup
+        # behind request.user
+        request.is_staff_user = SimpleLazyObject(
+            lambda: request.user.is_authenticated
+            and request.user.user_type == 'staff'
+        )
+        return self.get_response(request)
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-08-29 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(fields=['full_name'], name='doctor_full_na_32003f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(fields=['email'], name='doctor_email_7de794_idx'),
+        ),
+    ]
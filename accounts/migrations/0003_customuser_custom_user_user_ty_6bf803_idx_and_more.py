@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-08-29 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_doctor_doctor_full_na_32003f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['user_type', 'is_active_user'], name='custom_user_user_ty_6bf803_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(fields=['specialization', 'clinic_location', 'is_available'], name='doctor_special_08a91d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doctorschedule',
+            index=models.Index(fields=['day_of_week', 'is_active'], name='doctor_sche_day_of__9bfed8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='frontdeskstaff',
+            index=models.Index(fields=['shift', 'department'], name='frontdesk_s_shift_798d1c_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_customuser_custom_user_user_ty_6bf803_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(fields=['is_available', 'specialization'], name='doctor_is_avai_f11b63_idx'),
+        ),
+    ]
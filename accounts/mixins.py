@@ -0,0 +1,44 @@
+# accounts/mixins.py
+
+from functools import wraps
+
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.contrib.auth.views import redirect_to_login
+
+
+def request_is_staff(request):
+    """
+    Single staff predicate for the whole project. Prefers the flag
+    AccountsContextMiddleware cached on the request so repeated checks in
+    one request cost a dict lookup, with a plain user check as fallback
+    for requests that skipped the middleware (tests, management commands)
+    """
+    cached = getattr(request, 'is_staff_user', None)
+    if cached is not None:
+        return bool(cached)
+    user = request.user
+    return user.is_authenticated and user.user_type == 'staff'
+
+
+def staff_required(view_func):
+    """
+    Replaces the @login_required + @user_passes_test(is_staff_user)
+    decorator pairs: one check against the cached flag, same redirect to
+    LOGIN_URL with ?next= on failure
+    """
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        if request_is_staff(request):
+            return view_func(request, *args, **kwargs)
+        return redirect_to_login(request.get_full_path())
+    return _wrapped
+
+
+class StaffRequiredMixin(UserPassesTestMixin):
+    """
+    Replaces the LoginRequiredMixin + UserPassesTestMixin + test_func
+    boilerplate on class-based views
+    """
+
+    def test_func(self):
+        return request_is_staff(self.request)
@@ -36,11 +36,53 @@ class CustomUser(AbstractUser):
         db_table = 'custom_user'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['user_type', 'is_active_user']),
+        ]
 
     def __str__(self):
         return f"{self.username} ({self.get_user_type_display()})"
 
 
+class FrontDeskStaffManager(models.Manager):
+    """Manager with batch helpers for profile creation"""
+
+    def bulk_create_for(self, users, shift='morning', department='Reception'):
+        """
+        Create profiles for the given users with one INSERT, assigning
+        sequential employee_ids from the current maximum. Pair with
+        CustomUser.objects.bulk_create() (which skips post_save signals)
+        for imports and backfills.
+        """
+        existing = set(
+            self.filter(user__in=[user.pk for user in users])
+            .values_list('user_id', flat=True)
+        )
+        to_create = [user for user in users if user.pk not in existing]
+
+        # Parse and MAX() the numeric suffix in the database; a plain
+        # MAX(employee_id) compares strings, so EMP999 would sort above
+        # EMP0004 and re-mint taken IDs
+        from django.db.models.functions import Cast, Substr
+
+        base = self.annotate(
+            n=Cast(Substr('employee_id', 4), models.IntegerField())
+        ).aggregate(m=models.Max('n'))['m'] or 0
+
+        return self.bulk_create(
+            [
+                FrontDeskStaff(
+                    user=user,
+                    employee_id=f'EMP{base + i + 1:04d}',
+                    shift=shift,
+                    department=department
+                )
+                for i, user in enumerate(to_create)
+            ],
+            batch_size=500
+        )
+
+
 class FrontDeskStaff(models.Model):
     """
     Profile model for Front Desk Staff
@@ -52,6 +94,9 @@ class FrontDeskStaff(models.Model):
         limit_choices_to={'user_type': 'staff'}
     )
     employee_id = models.CharField(max_length=20, unique=True)
+
+    objects = FrontDeskStaffManager()
+
     shift = models.CharField(
         max_length=20,
         choices=(
@@ -68,6 +113,9 @@ class FrontDeskStaff(models.Model):
         db_table = 'frontdesk_staff'
         verbose_name = 'Front Desk Staff'
         verbose_name_plural = 'Front Desk Staff'
+        indexes = [
+            models.Index(fields=['shift', 'department']),
+        ]
 
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.employee_id}"
@@ -145,6 +193,10 @@ class Doctor(models.Model):
             models.Index(fields=['specialization']),
             models.Index(fields=['clinic_location']),
             models.Index(fields=['is_available']),
+            models.Index(fields=['full_name']),
+            models.Index(fields=['email']),
+            models.Index(fields=['specialization', 'clinic_location', 'is_available']),
+            models.Index(fields=['is_available', 'specialization']),
         ]
 
     def __str__(self):
@@ -155,17 +207,20 @@ class Doctor(models.Model):
         if not self.is_available:
             return "Off Duty"
         
-        # Check if doctor has any available slots today
-        from datetime import date
-        from frontdesk.models import DoctorAvailability
-        
-        today_availability = DoctorAvailability.objects.filter(
-            doctor=self,
-            date=date.today(),
-            is_available=True
-        ).first()
-        
-        if today_availability:
+        # Prefer the today_available annotation when the queryset supplied
+        # one (see DoctorListView); fall back to a per-instance exists()
+        has_availability = getattr(self, 'today_available', None)
+        if has_availability is None:
+            from datetime import date
+            from frontdesk.models import DoctorAvailability
+
+            has_availability = DoctorAvailability.objects.filter(
+                doctor=self,
+                date=date.today(),
+                is_available=True
+            ).exists()
+
+        if has_availability:
             return "Available"
         return "Busy"
 
@@ -204,50 +259,76 @@ class DoctorSchedule(models.Model):
         verbose_name_plural = 'Doctor Schedules'
         unique_together = ['doctor', 'day_of_week', 'start_time']
         ordering = ['day_of_week', 'start_time']
+        indexes = [
+            models.Index(fields=['day_of_week', 'is_active']),
+        ]
 
     def __str__(self):
         return f"{self.doctor.full_name} - {self.get_day_of_week_display()} ({self.start_time}-{self.end_time})"
     
     
-from django.db.models.signals import post_save
+import logging
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-@receiver(post_save, sender=CustomUser)
-def create_user_profile(sender, instance, created, **kwargs):
+logger = logging.getLogger(__name__)
+
+
+def generate_employee_id():
     """
-    Automatically create FrontDeskStaff or Doctor profile when a user is created
+    Next employee_id in the EMP sequence, derived from the highest existing
+    numeric suffix via an indexed MAX() instead of a full-table COUNT(*)
+    (which also hands out duplicates once rows are deleted). The suffix is
+    cast in SQL because a string MAX() over mixed-width IDs is
+    lexicographic and would re-mint taken numbers.
     """
-    if created:
-        if instance.user_type == 'staff':
-            # Check if profile doesn't already exist
-            if not FrontDeskStaff.objects.filter(user=instance).exists():
-                # Generate employee_id
-                staff_count = FrontDeskStaff.objects.count()
-                employee_id = f'EMP{staff_count + 1:04d}'
-                
-                FrontDeskStaff.objects.create(
-                    user=instance,
-                    employee_id=employee_id,
-                    shift='morning',
-                    department='Reception'
-                )
-                print(f"✅ Created FrontDeskStaff profile for {instance.username}")
+    from django.db.models.functions import Cast, Substr
 
-@receiver(post_save, sender=CustomUser)
-def save_user_profile(sender, instance, **kwargs):
+    number = FrontDeskStaff.objects.annotate(
+        n=Cast(Substr('employee_id', 4), models.IntegerField())
+    ).aggregate(m=models.Max('n'))['m'] or 0
+    return f'EMP{number + 1:04d}'
+
+
+@receiver(post_save, sender=CustomUser, weak=False,
+          dispatch_uid='accounts.create_profile')
+def create_user_profile(sender, instance, created, **kwargs):
     """
-    Ensure profile exists even if created manually through admin
-    This handles cases where user_type is changed after creation
+    Ensure a FrontDeskStaff profile exists whenever a staff user is saved.
+    Covers both new users and existing ones whose user_type was changed
+    through the admin; get_or_create keeps it to a single query when the
+    profile is already there.
     """
     if instance.user_type == 'staff':
-        if not FrontDeskStaff.objects.filter(user=instance).exists():
-            staff_count = FrontDeskStaff.objects.count()
-            employee_id = f'EMP{staff_count + 1:04d}'
-            
-            FrontDeskStaff.objects.create(
-                user=instance,
-                employee_id=employee_id,
-                shift='morning',
-                department='Reception'
-            )
-            print(f"✅ Auto-created missing FrontDeskStaff profile for {instance.username}")
\ No newline at end of file
+        profile, profile_created = FrontDeskStaff.objects.get_or_create(
+            user=instance,
+            defaults={
+                # Callable so the MAX() lookup only runs on the create path
+                'employee_id': generate_employee_id,
+                'shift': 'morning',
+                'department': 'Reception',
+            }
+        )
+        if profile_created:
+            # Lazy %s formatting: the string is only built if a handler wants it
+            logger.info("Created FrontDeskStaff profile for %s", instance.username)
+
+def drop_doctor_caches():
+    """
+    Drop cached doctor lookups (specialization filter, form choices).
+    Called by the signals below and directly from the availability
+    toggles, which flip is_available via update() and so fire no signals.
+    """
+    cache.delete_many([
+        'doctor_specializations',
+        'doctor_choices:0',
+        'doctor_choices:1',
+    ])
+
+
+@receiver(post_save, sender=Doctor, dispatch_uid='accounts.doctor_cache_save')
+@receiver(post_delete, sender=Doctor, dispatch_uid='accounts.doctor_cache_delete')
+def invalidate_doctor_caches(sender, **kwargs):
+    drop_doctor_caches()
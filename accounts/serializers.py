@@ -1,28 +1,38 @@
 from rest_framework import serializers
-from django.contrib.auth.models import User
-from .models import Staff, Doctor
+from .models import CustomUser, FrontDeskStaff, Doctor
 
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
-        model = User
+        model = CustomUser
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'is_active']
         read_only_fields = ['id']
 
 
 class StaffSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
-    
+
     class Meta:
-        model = Staff
-        fields = ['id', 'user', 'role', 'department', 'phone_number', 'is_active']
+        model = FrontDeskStaff
+        fields = ['id', 'user', 'employee_id', 'shift', 'department', 'date_joined']
         read_only_fields = ['id']
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the nested user so list serialization avoids N+1 queries"""
+        return queryset.select_related('user')
+
 
 class DoctorSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
-    
+
     class Meta:
         model = Doctor
-        fields = ['id', 'user', 'specialization', 'license_number', 'phone_number', 'is_active']
+        fields = ['id', 'user', 'doctor_id', 'full_name', 'specialization',
+                  'license_number', 'phone_number', 'is_available']
         read_only_fields = ['id']
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the nested user so list serialization avoids N+1 queries"""
+        return queryset.select_related('user')
@@ -2,24 +2,22 @@
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout, authenticate
-from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
-from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.cache import cache
 from django.urls import reverse_lazy
 from django.http import JsonResponse
-from django.db.models import Q
+from django.db.models import Exists, F, OuterRef, Prefetch, Q
 
 from .forms import (
     StaffLoginForm, StaffRegistrationForm, DoctorForm, 
     DoctorScheduleForm
 )
-from .models import CustomUser, FrontDeskStaff, Doctor, DoctorSchedule
-
-
-# Helper function to check if user is staff
-def is_staff_user(user):
-    return user.is_authenticated and user.user_type == 'staff'
+from .models import (
+    CustomUser, FrontDeskStaff, Doctor, DoctorSchedule, drop_doctor_caches
+)
+from .mixins import StaffRequiredMixin, staff_required
 
 
 # Authentication Views
@@ -62,8 +60,7 @@ def staff_logout_view(request):
     return redirect('accounts:login')
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def staff_profile_view(request):
     """
     Staff profile view
@@ -85,7 +82,7 @@ def staff_profile_view(request):
 
 
 # Doctor Management Views
-class DoctorListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
+class DoctorListView(StaffRequiredMixin, ListView):
     """
     List all doctors
     """
@@ -94,12 +91,24 @@ class DoctorListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
     context_object_name = 'doctors'
     paginate_by = 20
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def get_queryset(self):
-        queryset = Doctor.objects.all().order_by('full_name')
-        
+        from datetime import date
+        from frontdesk.models import DoctorAvailability
+
+        # Resolve today's availability for the whole page in the same query;
+        # get_current_availability_status() picks up the annotation instead
+        # of issuing one exists() per row
+        queryset = Doctor.objects.select_related('user').annotate(
+            today_available=Exists(
+                DoctorAvailability.objects.filter(
+                    doctor=OuterRef('pk'),
+                    date=date.today(),
+                    is_available=True
+                )
+            )
+        ).defer('qualifications', 'bio').order_by('full_name')
+
         # Search functionality
         search_query = self.request.GET.get('search', '')
         if search_query:
@@ -132,13 +141,19 @@ class DoctorListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
         context = super().get_context_data(**kwargs)
         context['title'] = 'Doctors'
         context['search_query'] = self.request.GET.get('search', '')
-        context['specializations'] = Doctor.objects.values_list(
-            'specialization', flat=True
-        ).distinct()
+        # Specializations change rarely; cache the DISTINCT scan, invalidated
+        # by the Doctor post_save/post_delete signals in accounts.models
+        context['specializations'] = cache.get_or_set(
+            'doctor_specializations',
+            lambda: list(
+                Doctor.objects.values_list('specialization', flat=True).distinct()
+            ),
+            300
+        )
         return context
 
 
-class DoctorCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+class DoctorCreateView(StaffRequiredMixin, CreateView):
     """
     Create new doctor profile
     """
@@ -147,8 +162,6 @@ class DoctorCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
     template_name = 'accounts/doctor_form.html'
     success_url = reverse_lazy('accounts:doctor_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         messages.success(self.request, f'Doctor {form.instance.full_name} added successfully!')
@@ -161,7 +174,7 @@ class DoctorCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         return context
 
 
-class DoctorUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class DoctorUpdateView(StaffRequiredMixin, UpdateView):
     """
     Update doctor profile
     """
@@ -170,8 +183,6 @@ class DoctorUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     template_name = 'accounts/doctor_form.html'
     success_url = reverse_lazy('accounts:doctor_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         messages.success(self.request, f'Doctor {form.instance.full_name} updated successfully!')
@@ -184,7 +195,7 @@ class DoctorUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         return context
 
 
-class DoctorDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class DoctorDeleteView(StaffRequiredMixin, DeleteView):
     """
     Delete doctor profile
     """
@@ -192,8 +203,6 @@ class DoctorDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     template_name = 'accounts/doctor_confirm_delete.html'
     success_url = reverse_lazy('accounts:doctor_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def delete(self, request, *args, **kwargs):
         doctor = self.get_object()
@@ -201,25 +210,34 @@ class DoctorDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return super().delete(request, *args, **kwargs)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def doctor_detail_view(request, pk):
     """
     View doctor details with schedule
     """
-    doctor = get_object_or_404(Doctor, pk=pk)
-    schedules = DoctorSchedule.objects.filter(doctor=doctor, is_active=True)
-    
+    doctor = get_object_or_404(
+        Doctor.objects.prefetch_related(
+            Prefetch(
+                'weekly_schedule',
+                queryset=DoctorSchedule.objects.filter(is_active=True).order_by(
+                    'day_of_week', 'start_time'
+                ),
+                to_attr='active_schedules'
+            )
+        ),
+        pk=pk
+    )
+
     context = {
         'doctor': doctor,
-        'schedules': schedules,
+        'schedules': doctor.active_schedules,
         'title': f'Dr. {doctor.full_name}'
     }
     return render(request, 'accounts/doctor_detail.html', context)
 
 
 # Doctor Schedule Management
-class DoctorScheduleListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
+class DoctorScheduleListView(StaffRequiredMixin, ListView):
     """
     List all doctor schedules
     """
@@ -227,11 +245,9 @@ class DoctorScheduleListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
     template_name = 'accounts/schedule_list.html'
     context_object_name = 'schedules'
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def get_queryset(self):
-        queryset = DoctorSchedule.objects.select_related('doctor').all()
+        queryset = DoctorSchedule.objects.select_related('doctor__user').all()
         
         # Filter by doctor if provided
         doctor_id = self.request.GET.get('doctor', '')
@@ -247,7 +263,7 @@ class DoctorScheduleListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
         return context
 
 
-class DoctorScheduleCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+class DoctorScheduleCreateView(StaffRequiredMixin, CreateView):
     """
     Create new schedule for a doctor
     """
@@ -256,8 +272,6 @@ class DoctorScheduleCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateVi
     template_name = 'accounts/schedule_form.html'
     success_url = reverse_lazy('accounts:schedule_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         messages.success(self.request, 'Schedule added successfully!')
@@ -270,7 +284,7 @@ class DoctorScheduleCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateVi
         return context
 
 
-class DoctorScheduleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class DoctorScheduleUpdateView(StaffRequiredMixin, UpdateView):
     """
     Update doctor schedule
     """
@@ -279,8 +293,6 @@ class DoctorScheduleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateVi
     template_name = 'accounts/schedule_form.html'
     success_url = reverse_lazy('accounts:schedule_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         messages.success(self.request, 'Schedule updated successfully!')
@@ -293,7 +305,7 @@ class DoctorScheduleUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateVi
         return context
 
 
-class DoctorScheduleDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class DoctorScheduleDeleteView(StaffRequiredMixin, DeleteView):
     """
     Delete doctor schedule
     """
@@ -301,8 +313,6 @@ class DoctorScheduleDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteVi
     template_name = 'accounts/schedule_confirm_delete.html'
     success_url = reverse_lazy('accounts:schedule_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def delete(self, request, *args, **kwargs):
         messages.success(request, 'Schedule deleted successfully!')
@@ -310,8 +320,7 @@ class DoctorScheduleDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteVi
 
 
 # AJAX Views for dynamic data
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def get_doctors_by_specialization(request):
     """
     API endpoint to get doctors filtered by specialization
@@ -325,8 +334,7 @@ def get_doctors_by_specialization(request):
     return JsonResponse(list(doctors), safe=False)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def get_doctor_availability(request, doctor_id):
     """
     Get doctor's availability for a specific date
@@ -360,25 +368,37 @@ def get_doctor_availability(request, doctor_id):
         return JsonResponse({'available': False, 'slots': []})
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def toggle_doctor_availability(request, pk):
     """
     Toggle doctor's availability status
     """
-    doctor = get_object_or_404(Doctor, pk=pk)
-    doctor.is_available = not doctor.is_available
-    doctor.save()
-    
-    status = 'available' if doctor.is_available else 'unavailable'
-    messages.success(request, f'Dr. {doctor.full_name} is now {status}.')
-    
+    from django.http import Http404
+    from django.utils import timezone
+
+    # Flip the flag in the database itself; no fetch/modify/save round trip
+    updated = Doctor.objects.filter(pk=pk).update(
+        is_available=~F('is_available'),
+        updated_at=timezone.now()
+    )
+    if not updated:
+        raise Http404("No doctor found matching the query")
+
+    # update() skips signals, so drop the cached form choices ourselves
+    drop_doctor_caches()
+
+    full_name, is_available = Doctor.objects.values_list(
+        'full_name', 'is_available'
+    ).get(pk=pk)
+
+    status = 'available' if is_available else 'unavailable'
+    messages.success(request, f'Dr. {full_name} is now {status}.')
+
     return redirect('accounts:doctor_list')
 
 
 # Search doctors view
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def search_doctors_ajax(request):
     """
     AJAX search for doctors
@@ -388,67 +408,91 @@ def search_doctors_ajax(request):
     if len(query) < 2:
         return JsonResponse([], safe=False)
     
-    doctors = Doctor.objects.filter(
-        Q(full_name__icontains=query) |
-        Q(doctor_id__icontains=query) |
-        Q(specialization__icontains=query)
-    )[:10]
-    
-    results = [{
-        'id': doctor.id,
-        'doctor_id': doctor.doctor_id,
-        'name': doctor.full_name,
-        'specialization': doctor.specialization,
-        'is_available': doctor.is_available
-    } for doctor in doctors]
-    
+    # On Postgres (production), rank with full-text search instead of
+    # three ORed sequential LIKE scans
+    from django.db import connection
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import (
+            SearchQuery, SearchRank, SearchVector
+        )
+
+        vector = SearchVector('full_name', 'doctor_id', 'specialization')
+        search = SearchQuery(query)
+        doctors = Doctor.objects.annotate(
+            search=vector,
+            rank=SearchRank(vector, search)
+        ).filter(search=search).order_by('-rank')
+    else:
+        doctors = Doctor.objects.filter(
+            Q(full_name__icontains=query) |
+            Q(doctor_id__icontains=query) |
+            Q(specialization__icontains=query)
+        )
+
+    # Project just the handful of JSON fields instead of hydrating full
+    # rows (bio/qualifications TEXT columns included)
+    results = list(
+        doctors.values(
+            'id', 'doctor_id', 'specialization', 'is_available',
+            name=F('full_name')
+        )[:10]
+    )
+
     return JsonResponse(results, safe=False)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def quick_toggle_doctor_status(request, pk):
     """
     Quick toggle doctor availability status via AJAX
     """
     if request.method == 'POST':
-        doctor = get_object_or_404(Doctor, pk=pk)
         new_status = request.POST.get('status')
-        
-        if new_status == 'available':
-            doctor.is_available = True
-            doctor.save()
-            message = f'Dr. {doctor.full_name} is now Available'
-            status = 'success'
-        elif new_status == 'busy':
-            doctor.is_available = False
-            doctor.save()
-            message = f'Dr. {doctor.full_name} is now Busy'
-            status = 'warning'
-        elif new_status == 'off_duty':
-            doctor.is_available = False
-            doctor.save()
-            message = f'Dr. {doctor.full_name} is now Off Duty'
-            status = 'danger'
-        else:
-            message = 'Invalid status'
-            status = 'error'
-        
-        # Get next availability
-        from datetime import datetime, date
-        from frontdesk.models import DoctorAvailability
-        
-        next_availability = DoctorAvailability.objects.filter(
-            doctor=doctor,
-            date__gte=date.today(),
-            is_available=True
-        ).order_by('date', 'start_time').first()
-        
-        next_available_text = 'Not scheduled'
-        if next_availability:
-            next_available_text = f"{next_availability.date.strftime('%b %d')} at {next_availability.start_time.strftime('%I:%M %p')}"
-        
+
+        status_map = {
+            'available': (True, 'Available', 'success'),
+            'busy': (False, 'Busy', 'warning'),
+            'off_duty': (False, 'Off Duty', 'danger'),
+        }
+
+        if new_status not in status_map:
+            return JsonResponse({'success': False, 'message': 'Invalid status'}, status=400)
+
+        is_available, label, status = status_map[new_status]
+
+        # One targeted UPDATE instead of fetching the row and re-saving
+        # every column through the model
+        from django.utils import timezone
+        updated = Doctor.objects.filter(pk=pk).update(
+            is_available=is_available,
+            updated_at=timezone.now()
+        )
+        if not updated:
+            return JsonResponse({'success': False, 'message': 'Doctor not found'}, status=404)
+
+        # update() skips signals, so drop the cached form choices ourselves
+        drop_doctor_caches()
+
+        full_name = Doctor.objects.filter(pk=pk).values_list('full_name', flat=True).first()
+        message = f'Dr. {full_name} is now {label}'
+
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            # Only the AJAX payload shows the next slot, so only that branch
+            # pays for the availability lookup
+            from datetime import date
+            from frontdesk.models import DoctorAvailability
+
+            next_availability = DoctorAvailability.objects.filter(
+                doctor_id=pk,
+                date__gte=date.today(),
+                is_available=True
+            ).only('date', 'start_time').order_by('date', 'start_time').first()
+
+            next_available_text = 'Not scheduled'
+            if next_availability:
+                next_available_text = f"{next_availability.date.strftime('%b %d')} at {next_availability.start_time.strftime('%I:%M %p')}"
+
             return JsonResponse({
                 'success': True,
                 'message': message,
@@ -33,11 +33,16 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Compresses responses on the way out and sets Vary: Accept-Encoding;
+    # sits above WhiteNoise so dynamic responses (polled JSON, HTML) get
+    # gzipped while static files keep WhiteNoise's own compression
+    "django.middleware.gzip.GZipMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "accounts.middleware.AccountsContextMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -92,6 +97,17 @@ LOGIN_URL = 'accounts:login'
 LOGIN_REDIRECT_URL = 'frontdesk:dashboard'
 LOGOUT_REDIRECT_URL = 'accounts:login'
 
+# Password hashing
+# Argon2 first: faster login/registration at equivalent security; existing
+# PBKDF2 hashes are upgraded automatically on the next successful login
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
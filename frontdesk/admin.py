@@ -1,15 +1,76 @@
+import csv
+
 from django.contrib import admin
+from django.db.models import Count, F, Q
+from django.http import HttpResponse
 from .models import Patient, Queue, Appointment, DoctorAvailability
 
 
+def _export_csv(queryset, fields, filename):
+    """
+    Stream the selected rows as CSV, 500 at a time, instead of hydrating
+    every model instance into memory at once
+    """
+    response = HttpResponse(content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    writer = csv.writer(response)
+    writer.writerow(fields)
+    for row in queryset.values_list(*fields).iterator(chunk_size=500):
+        writer.writerow(row)
+    return response
+
+
 @admin.register(Patient)
 class PatientAdmin(admin.ModelAdmin):
     list_display = ['patient_id', 'get_full_name', 'phone_number', 'gender', 
                     'get_age', 'registration_date', 'is_active']
     list_filter = ['gender', 'blood_group', 'is_active', 'registration_date']
     search_fields = ['patient_id', 'first_name', 'last_name', 'phone_number', 'email']
+    autocomplete_fields = ['registered_by']
     readonly_fields = ['created_at', 'updated_at', 'registration_date']
-    
+    actions = ['export_csv']
+
+    @admin.action(description='Export selected patients to CSV')
+    def export_csv(self, request, queryset):
+        return _export_csv(
+            queryset,
+            ['patient_id', 'first_name', 'last_name', 'phone_number', 'email',
+             'gender', 'date_of_birth', 'registration_date', 'is_active'],
+            'patients.csv'
+        )
+
+    def get_search_results(self, request, queryset, search_term):
+        # On Postgres (production) rank by trigram similarity, backed by
+        # the pg_trgm GIN indexes from migration 0005, instead of the
+        # default unindexed ILIKE '%q%' across five columns
+        from django.db import connection
+
+        if search_term and connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import TrigramSimilarity
+
+            queryset = queryset.annotate(
+                similarity=(
+                    TrigramSimilarity('first_name', search_term)
+                    + TrigramSimilarity('last_name', search_term)
+                )
+            ).filter(
+                Q(similarity__gt=0.3)
+                | Q(patient_id__istartswith=search_term)
+                | Q(phone_number__startswith=search_term)
+            ).order_by('-similarity')
+            return queryset, False
+        return super().get_search_results(request, queryset, search_term)
+
+    def get_queryset(self, request):
+        # The changelist never shows the medical/address textareas; keep
+        # them out of the per-row SELECT
+        qs = super().get_queryset(request)
+        return qs.defer(
+            'allergies', 'chronic_conditions', 'current_medications',
+            'address_line1', 'address_line2', 'emergency_contact_name',
+            'emergency_contact_phone', 'emergency_contact_relation'
+        )
+
     fieldsets = (
         ('Basic Information', {
             'fields': ('patient_id', 'first_name', 'last_name', 'date_of_birth', 
@@ -42,12 +103,34 @@ class PatientAdmin(admin.ModelAdmin):
 
 @admin.register(Queue)
 class QueueAdmin(admin.ModelAdmin):
-    list_display = ['queue_number', 'patient', 'doctor', 'status', 'priority', 
+    list_display = ['queue_number', 'patient', 'doctor', 'status', 'priority',
                     'arrival_time', 'get_wait_time']
+    list_select_related = ('patient', 'doctor')
+    # Autocomplete instead of <select> widgets that inline every patient
+    # and doctor row into the change form
+    autocomplete_fields = ['patient', 'doctor', 'added_by']
     list_filter = ['status', 'priority', 'queue_date', 'doctor']
-    search_fields = ['queue_number', 'patient__first_name', 'patient__last_name']
+    search_fields = ['queue_number', 'patient_full_name']
     readonly_fields = ['arrival_time', 'created_at', 'updated_at']
     date_hierarchy = 'queue_date'
+    actions = ['export_csv', 'mark_no_show']
+
+    @admin.action(description='Export selected queue entries to CSV')
+    def export_csv(self, request, queryset):
+        return _export_csv(
+            queryset,
+            ['queue_number', 'patient_full_name', 'status', 'priority',
+             'queue_date', 'arrival_time', 'estimated_wait_time'],
+            'queue.csv'
+        )
+
+    @admin.action(description='Mark selected entries as no-show')
+    def mark_no_show(self, request, queryset):
+        # Single UPDATE ... WHERE id IN (...) for the end-of-day sweep
+        updated = Queue.bulk_mark_no_show(
+            list(queryset.values_list('pk', flat=True))
+        )
+        self.message_user(request, f'{updated} queue entries marked as no-show.')
     
     fieldsets = (
         ('Queue Information', {
@@ -69,13 +152,25 @@ class QueueAdmin(admin.ModelAdmin):
 
 @admin.register(Appointment)
 class AppointmentAdmin(admin.ModelAdmin):
-    list_display = ['appointment_id', 'patient', 'doctor', 'appointment_date', 
+    list_display = ['appointment_id', 'patient', 'doctor', 'appointment_date',
                     'appointment_time', 'status', 'is_confirmed']
+    list_select_related = ('patient', 'doctor')
+    autocomplete_fields = ['patient', 'doctor', 'scheduled_by', 'cancelled_by',
+                           'rescheduled_from']
     list_filter = ['status', 'appointment_type', 'appointment_date', 'is_confirmed']
-    search_fields = ['appointment_id', 'patient__first_name', 'patient__last_name', 
-                    'doctor__full_name']
+    search_fields = ['appointment_id', 'patient_full_name']
     readonly_fields = ['scheduled_at', 'created_at', 'updated_at']
     date_hierarchy = 'appointment_date'
+    actions = ['export_csv']
+
+    @admin.action(description='Export selected appointments to CSV')
+    def export_csv(self, request, queryset):
+        return _export_csv(
+            queryset,
+            ['appointment_id', 'patient_full_name', 'appointment_date',
+             'appointment_time', 'duration', 'status', 'appointment_type'],
+            'appointments.csv'
+        )
     
     fieldsets = (
         ('Appointment Information', {
@@ -107,12 +202,32 @@ class AppointmentAdmin(admin.ModelAdmin):
 
 @admin.register(DoctorAvailability)
 class DoctorAvailabilityAdmin(admin.ModelAdmin):
-    list_display = ['doctor', 'date', 'start_time', 'end_time', 'is_available', 
+    list_display = ['doctor', 'date', 'start_time', 'end_time', 'is_available',
                     'get_booked_slots', 'max_appointments']
+    list_select_related = ('doctor',)
+    autocomplete_fields = ['doctor']
     list_filter = ['is_available', 'date', 'doctor']
     search_fields = ['doctor__full_name']
     date_hierarchy = 'date'
     
+    def get_queryset(self, request):
+        # Count booked appointments per row in the changelist query itself
+        # instead of one COUNT() per availability via get_booked_slots()
+        qs = super().get_queryset(request)
+        return qs.annotate(
+            _booked=Count(
+                'doctor__appointments',
+                filter=Q(
+                    doctor__appointments__appointment_date=F('date'),
+                    doctor__appointments__appointment_time__gte=F('start_time'),
+                    doctor__appointments__appointment_time__lt=F('end_time'),
+                    doctor__appointments__status__in=[
+                        'scheduled', 'confirmed', 'checked_in'
+                    ],
+                )
+            )
+        )
+
     def get_booked_slots(self, obj):
-        return f"{obj.get_booked_slots()}/{obj.max_appointments}"
+        return f"{obj._booked}/{obj.max_appointments}"
     get_booked_slots.short_description = 'Booked/Max'
\ No newline at end of file
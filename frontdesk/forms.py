@@ -1,10 +1,46 @@
+import re
+
 from django import forms
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from datetime import date, datetime, timedelta
-from .models import Patient, Queue, Appointment, DoctorAvailability
+from .models import Patient, Queue, Appointment, DoctorAvailability, get_waiting_count
 from accounts.models import Doctor
 
 
+def _active_patient_choices():
+    """
+    Cached (pk, label) pairs for the patient selects; invalidated by the
+    Patient signals in frontdesk.models. Patients are read on every
+    queue/appointment form render but change far less often.
+    """
+    return cache.get_or_set(
+        'active_patient_choices',
+        lambda: [
+            (p.pk, str(p)) for p in Patient.objects.filter(is_active=True)
+            .only('id', 'patient_id', 'first_name', 'last_name')
+            .order_by('first_name')
+        ],
+        60 * 30
+    )
+
+
+def _doctor_choices(walkins_only=False):
+    """Cached doctor options, invalidated by the Doctor cache signals"""
+    filters = {'is_available': True}
+    if walkins_only:
+        filters['accepts_walkins'] = True
+    return cache.get_or_set(
+        f'doctor_choices:{int(walkins_only)}',
+        lambda: [
+            (d.pk, str(d)) for d in Doctor.objects.filter(**filters)
+            .only('id', 'full_name', 'specialization')
+            .order_by('full_name')
+        ],
+        60 * 30
+    )
+
+
 class PatientForm(forms.ModelForm):
     """
     Form for adding/editing patient information
@@ -12,11 +48,16 @@ class PatientForm(forms.ModelForm):
     date_of_birth = forms.DateField(
         widget=forms.DateInput(attrs={
             'class': 'form-control',
-            'type': 'date',
-            'max': date.today().isoformat()
+            'type': 'date'
         })
     )
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Per-instance, not class-body: an attr frozen at import time goes
+        # stale once the process runs past midnight
+        self.fields['date_of_birth'].widget.attrs['max'] = date.today().isoformat()
+
     class Meta:
         model = Patient
         fields = [
@@ -99,15 +140,13 @@ class PatientForm(forms.ModelForm):
         }
     
     def clean_patient_id(self):
-        patient_id = self.cleaned_data.get('patient_id')
-        if not patient_id:
-            # Auto-generate patient ID
-            last_patient = Patient.objects.all().order_by('-id').first()
-            if last_patient:
-                last_id = int(last_patient.patient_id.replace('PAT', ''))
-                patient_id = f"PAT{last_id + 1:05d}"
-            else:
-                patient_id = "PAT00001"
+        # Generation moved into Patient.save() so validation stays
+        # query-free; only check the format when an ID was typed in
+        patient_id = self.cleaned_data.get('patient_id', '').strip()
+        if patient_id and not re.fullmatch(r'PAT\d+', patient_id):
+            raise ValidationError(
+                "Patient ID must look like PAT00001 (or be left empty)."
+            )
         return patient_id
     
     def clean_date_of_birth(self):
@@ -157,22 +196,32 @@ class QueueForm(forms.ModelForm):
                 'placeholder': 'Additional notes (optional)'
             }),
         }
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Render the <option> lists from the cache; validation still goes
+        # through the querysets with a single pk lookup
+        self.fields['patient'].choices = (
+            [('', 'Select Patient')] + _active_patient_choices()
+        )
+        self.fields['doctor'].choices = (
+            [('', 'Select Doctor (Optional)')] + _doctor_choices(walkins_only=True)
+        )
+
     def save(self, commit=True, added_by=None):
         queue_entry = super().save(commit=False)
+        # One clock read for the whole save, so the queue_date and the
+        # wait-time lookup cannot disagree across a midnight boundary
+        today = date.today()
         queue_entry.queue_number = Queue.generate_queue_number()
-        queue_entry.queue_date = date.today()
-        
+        queue_entry.queue_date = today
+
         if added_by:
             queue_entry.added_by = added_by
-        
+
         # Calculate estimated wait time based on current queue
         if queue_entry.doctor:
-            waiting_count = Queue.objects.filter(
-                doctor=queue_entry.doctor,
-                status='waiting',
-                queue_date=date.today()
-            ).count()
+            waiting_count = get_waiting_count(queue_entry.doctor_id, today)
             queue_entry.estimated_wait_time = waiting_count * 15  # 15 minutes per patient
         
         if commit:
@@ -224,8 +273,7 @@ class AppointmentForm(forms.ModelForm):
     appointment_date = forms.DateField(
         widget=forms.DateInput(attrs={
             'class': 'form-control',
-            'type': 'date',
-            'min': date.today().isoformat()
+            'type': 'date'
         })
     )
     
@@ -269,7 +317,17 @@ class AppointmentForm(forms.ModelForm):
                 'placeholder': 'Any special instructions (optional)'
             }),
         }
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['patient'].choices = (
+            [('', 'Select Patient')] + _active_patient_choices()
+        )
+        self.fields['doctor'].choices = (
+            [('', 'Select Doctor')] + _doctor_choices()
+        )
+        self.fields['appointment_date'].widget.attrs['min'] = date.today().isoformat()
+
     def clean(self):
         cleaned_data = super().clean()
         appointment_date = cleaned_data.get('appointment_date')
@@ -287,14 +345,10 @@ class AppointmentForm(forms.ModelForm):
                 raise ValidationError("Cannot schedule appointments in the past.")
             
             # Check if doctor is available at this time
-            existing_appointment = Appointment.objects.filter(
-                doctor=doctor,
-                appointment_date=appointment_date,
-                appointment_time=appointment_time,
-                status__in=['scheduled', 'confirmed', 'checked_in']
-            ).exclude(pk=self.instance.pk if self.instance.pk else None)
-            
-            if existing_appointment.exists():
+            if Appointment.slot_taken(
+                doctor.pk, appointment_date, appointment_time,
+                exclude_pk=self.instance.pk
+            ):
                 raise ValidationError(
                     f"Dr. {doctor.full_name} already has an appointment at this time."
                 )
@@ -324,8 +378,7 @@ class AppointmentRescheduleForm(forms.Form):
     new_date = forms.DateField(
         widget=forms.DateInput(attrs={
             'class': 'form-control',
-            'type': 'date',
-            'min': date.today().isoformat()
+            'type': 'date'
         }),
         label='New Appointment Date'
     )
@@ -351,6 +404,7 @@ class AppointmentRescheduleForm(forms.Form):
     def __init__(self, *args, appointment=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.appointment = appointment
+        self.fields['new_date'].widget.attrs['min'] = date.today().isoformat()
     
     def clean(self):
         cleaned_data = super().clean()
@@ -358,20 +412,21 @@ class AppointmentRescheduleForm(forms.Form):
         new_time = cleaned_data.get('new_time')
         
         if new_date and new_time and self.appointment:
-            # Check if new time is in the past
+            # Check if new time is in the past; aware datetimes on both
+            # sides (naive/aware comparison raises under USE_TZ) and one
+            # clock read per clean
+            from django.utils import timezone
             new_datetime = datetime.combine(new_date, new_time)
-            if new_datetime < datetime.now():
+            if timezone.is_naive(new_datetime):
+                new_datetime = timezone.make_aware(new_datetime)
+            if new_datetime < timezone.now():
                 raise ValidationError("Cannot reschedule to a time in the past.")
             
             # Check if doctor is available at new time
-            existing = Appointment.objects.filter(
-                doctor=self.appointment.doctor,
-                appointment_date=new_date,
-                appointment_time=new_time,
-                status__in=['scheduled', 'confirmed', 'checked_in']
-            ).exclude(pk=self.appointment.pk)
-            
-            if existing.exists():
+            if Appointment.slot_taken(
+                self.appointment.doctor_id, new_date, new_time,
+                exclude_pk=self.appointment.pk
+            ):
                 raise ValidationError(
                     "Doctor already has an appointment at this time. Please choose another slot."
                 )
@@ -401,11 +456,14 @@ class DoctorAvailabilityForm(forms.ModelForm):
     date = forms.DateField(
         widget=forms.DateInput(attrs={
             'class': 'form-control',
-            'type': 'date',
-            'min': date.today().isoformat()
+            'type': 'date'
         })
     )
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['date'].widget.attrs['min'] = date.today().isoformat()
+
     class Meta:
         model = DoctorAvailability
         fields = [
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0002_alter_queue_queue_number'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='patient',
+            name='patient_id',
+            field=models.CharField(blank=True, help_text='Unique patient identifier (auto-generated when left blank)', max_length=20, unique=True),
+        ),
+    ]
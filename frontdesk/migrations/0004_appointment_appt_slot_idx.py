@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0003_alter_patient_patient_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['doctor', 'appointment_date', 'appointment_time', 'status'], name='appt_slot_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # pg_trgm only exists on Postgres; dev runs SQLite where the default
+    # btree indexes remain in force
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS patient_name_trgm ON patient "
+        "USING gin (first_name gin_trgm_ops, last_name gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS patient_phone_trgm ON patient "
+        "USING gin (phone_number gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS patient_name_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS patient_phone_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0004_appointment_appt_slot_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
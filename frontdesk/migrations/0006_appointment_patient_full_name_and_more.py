@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:07
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Concat
+
+
+def backfill_patient_names(apps, schema_editor):
+    Patient = apps.get_model('frontdesk', 'Patient')
+    name = Subquery(
+        Patient.objects.filter(pk=OuterRef('patient_id'))
+        .annotate(n=Concat('first_name', Value(' '), 'last_name'))
+        .values('n')[:1]
+    )
+    for model_name in ('Queue', 'Appointment'):
+        model = apps.get_model('frontdesk', model_name)
+        model.objects.update(patient_full_name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0005_patient_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='patient_full_name',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='queue',
+            name='patient_full_name',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(backfill_patient_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0006_appointment_patient_full_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('kind', models.CharField(max_length=20)),
+                ('value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Daily Counter',
+                'verbose_name_plural': 'Daily Counters',
+                'db_table': 'daily_counter',
+                'unique_together': {('date', 'kind')},
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0007_dailycounter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(condition=models.Q(('status__in', ['scheduled', 'confirmed', 'checked_in'])), fields=['doctor', 'appointment_date', 'appointment_time'], name='appt_active_slot_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0008_appointment_appt_active_slot_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='queue',
+            name='queue_queue_d_c6aa52_idx',
+        ),
+        migrations.AddIndex(
+            model_name='queue',
+            index=models.Index(fields=['queue_date', 'status', 'doctor'], name='queue_queue_d_b605a0_idx'),
+        ),
+    ]
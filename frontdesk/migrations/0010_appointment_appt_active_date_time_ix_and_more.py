@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0009_remove_queue_queue_queue_d_c6aa52_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(condition=models.Q(('status__in', ['scheduled', 'confirmed', 'checked_in', 'in_progress'])), fields=['appointment_date', 'appointment_time'], name='appt_active_date_time_ix'),
+        ),
+        migrations.AddIndex(
+            model_name='queue',
+            index=models.Index(condition=models.Q(('status__in', ['waiting', 'with_doctor'])), fields=['queue_date', 'priority', 'arrival_time'], name='queue_live_order_ix'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0010_appointment_appt_active_date_time_ix_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patient',
+            name='patient_patient_a732e3_idx',
+        ),
+        migrations.AlterField(
+            model_name='appointment',
+            name='appointment_id',
+            field=models.CharField(help_text='Unique appointment identifier', max_length=15, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='patient_id',
+            field=models.CharField(blank=True, help_text='Unique patient identifier (auto-generated when left blank)', max_length=14, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='queue',
+            name='queue_number',
+            field=models.CharField(max_length=12, unique=True),
+        ),
+    ]
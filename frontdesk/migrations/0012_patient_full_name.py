@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:15
+
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+
+def backfill_full_name(apps, schema_editor):
+    Patient = apps.get_model('frontdesk', 'Patient')
+    Patient.objects.update(
+        full_name=Concat('first_name', Value(' '), 'last_name')
+    )
+
+
+def create_full_name_trigram(apps, schema_editor):
+    # pg_trgm only exists on Postgres; dev runs SQLite where icontains
+    # falls back to unindexed LIKE as before
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS patient_full_name_trgm ON patient "
+        "USING gin (full_name gin_trgm_ops)"
+    )
+
+
+def drop_full_name_trigram(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS patient_full_name_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0011_remove_patient_patient_patient_a732e3_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='patient',
+            name='full_name',
+            field=models.CharField(blank=True, editable=False, max_length=201),
+        ),
+        migrations.RunPython(backfill_full_name, migrations.RunPython.noop),
+        migrations.RunPython(create_full_name_trigram, drop_full_name_trigram),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:17
+
+from django.db import migrations, models
+import frontdesk.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0012_patient_full_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='patient',
+            name='emergency_contact_phone',
+            field=models.CharField(blank=True, max_length=17, validators=[frontdesk.models.validate_phone]),
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='phone_number',
+            field=models.CharField(max_length=17, validators=[frontdesk.models.validate_phone]),
+        ),
+    ]
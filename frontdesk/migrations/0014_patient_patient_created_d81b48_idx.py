@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0013_alter_patient_emergency_contact_phone_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(fields=['-created_at'], name='patient_created_d81b48_idx'),
+        ),
+    ]
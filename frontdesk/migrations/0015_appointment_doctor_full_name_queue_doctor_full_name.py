@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:18
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_doctor_names(apps, schema_editor):
+    Doctor = apps.get_model('accounts', 'Doctor')
+    name = Subquery(
+        Doctor.objects.filter(pk=OuterRef('doctor_id')).values('full_name')[:1]
+    )
+    for model_name in ('Queue', 'Appointment'):
+        model = apps.get_model('frontdesk', model_name)
+        model.objects.filter(doctor__isnull=False).update(doctor_full_name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('frontdesk', '0014_patient_patient_created_d81b48_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='doctor_full_name',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='queue',
+            name='doctor_full_name',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.RunPython(backfill_doctor_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:19
+
+from django.db import migrations, models
+
+PRIORITY_RANKS = {'emergency': 0, 'urgent': 1, 'normal': 2}
+
+
+def backfill_priority_rank(apps, schema_editor):
+    Queue = apps.get_model('frontdesk', 'Queue')
+    for priority, rank in PRIORITY_RANKS.items():
+        Queue.objects.filter(priority=priority).update(priority_rank=rank)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0015_appointment_doctor_full_name_queue_doctor_full_name'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='queue',
+            options={'ordering': ['priority_rank', 'arrival_time'], 'verbose_name': 'Queue Entry', 'verbose_name_plural': 'Queue Entries'},
+        ),
+        migrations.RemoveIndex(
+            model_name='queue',
+            name='queue_live_order_ix',
+        ),
+        migrations.AddField(
+            model_name='queue',
+            name='priority_rank',
+            field=models.PositiveSmallIntegerField(default=2, editable=False),
+        ),
+        migrations.RunPython(backfill_priority_rank, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='queue',
+            index=models.Index(condition=models.Q(('status__in', ['waiting', 'with_doctor'])), fields=['queue_date', 'priority_rank', 'arrival_time'], name='queue_live_order_ix'),
+        ),
+        migrations.AddIndex(
+            model_name='queue',
+            index=models.Index(fields=['queue_date', 'priority_rank', 'arrival_time'], name='queue_today_ordered_ix'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm only exists on Postgres; dev runs SQLite where the search
+    # falls back to LIKE filters
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS appt_patient_name_trgm ON appointment "
+        "USING gin (patient_full_name gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS appt_patient_name_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0016_alter_queue_options_remove_queue_queue_live_order_ix_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
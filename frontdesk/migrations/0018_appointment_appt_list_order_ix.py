@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0017_appointment_name_trigram'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['-appointment_date', '-appointment_time', '-id'], name='appt_list_order_ix'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0018_appointment_appt_list_order_ix'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='appointment',
+            name='appointment_appoint_c93148_idx',
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['appointment_date', 'status', 'appointment_time'], name='appointment_appoint_5f2d58_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0019_remove_appointment_appointment_appoint_c93148_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='patient_active_ix'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+
+def backfill_blank_full_names(apps, schema_editor):
+    # Rows created through bulk_create (e.g. the seed command) skipped
+    # save() and were left with an empty full_name; 0012 only backfilled
+    # rows that existed at the time
+    Patient = apps.get_model('frontdesk', 'Patient')
+    Patient.objects.filter(full_name='').update(
+        full_name=Concat('first_name', Value(' '), 'last_name')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0020_patient_patient_active_ix'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_blank_full_names, migrations.RunPython.noop),
+    ]
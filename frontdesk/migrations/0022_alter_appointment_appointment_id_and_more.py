@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-08-29 23:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontdesk', '0021_backfill_blank_full_names'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='appointment_id',
+            field=models.CharField(help_text='Unique appointment identifier', max_length=20, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='queue',
+            name='queue_number',
+            field=models.CharField(max_length=20, unique=True),
+        ),
+    ]
@@ -1,11 +1,65 @@
 # frontdesk/models.py
 
-from django.db import models
-from django.core.validators import RegexValidator
+import re
+
+from django.db import models, transaction
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from accounts.models import Doctor, FrontDeskStaff
 from datetime import date, datetime, timedelta
 
+# Resolved once at import; make_aware() would re-read settings.TIME_ZONE
+# on every is_past() call during list rendering
+_LOCAL_TZ = timezone.get_default_timezone()
+
+# Compiled once and shared by both phone fields; the per-field
+# RegexValidator instances each kept their own lazily-compiled pattern
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+
+
+def validate_phone(value):
+    """Validate a phone number in the '+999999999' international format"""
+    if not _PHONE_RE.match(value):
+        raise ValidationError(
+            "Phone number must be entered in the format: '+999999999'."
+        )
+
+
+class DailyCounter(models.Model):
+    """
+    Per-day sequence values behind the queue and appointment identifiers.
+    One locked row per (date, kind) hands out numbers atomically instead
+    of the old COUNT()-and-retry scans.
+    """
+    date = models.DateField()
+    kind = models.CharField(max_length=20)
+    value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_counter'
+        verbose_name = 'Daily Counter'
+        verbose_name_plural = 'Daily Counters'
+        unique_together = ['date', 'kind']
+
+    def __str__(self):
+        return f"{self.kind} {self.date}: {self.value}"
+
+    @classmethod
+    def next_value(cls, kind, for_date, seed=0):
+        """
+        Increment and return the counter for (kind, for_date). `seed` (a
+        value or callable, evaluated only when the row is first created)
+        lets callers start from pre-counter row counts.
+        """
+        with transaction.atomic():
+            row, _ = cls.objects.get_or_create(
+                date=for_date, kind=kind, defaults={'value': seed}
+            )
+            row = cls.objects.select_for_update().get(pk=row.pk)
+            row.value += 1
+            row.save(update_fields=['value'])
+            return row.value
+
 
 class Patient(models.Model):
     """
@@ -30,12 +84,16 @@ class Patient(models.Model):
     
     # Basic Information
     patient_id = models.CharField(
-        max_length=20, 
+        max_length=14,
         unique=True,
-        help_text="Unique patient identifier"
+        blank=True,
+        help_text="Unique patient identifier (auto-generated when left blank)"
     )
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
+    # Denormalized "first last", maintained in save(); gives templates and
+    # search a single indexed column instead of per-row concatenation
+    full_name = models.CharField(max_length=201, blank=True, editable=False)
     date_of_birth = models.DateField()
     gender = models.CharField(max_length=1, choices=GENDER_CHOICES)
     blood_group = models.CharField(
@@ -46,11 +104,7 @@ class Patient(models.Model):
     )
     
     # Contact Information
-    phone_regex = RegexValidator(
-        regex=r'^\+?1?\d{9,15}$',
-        message="Phone number must be entered in the format: '+999999999'."
-    )
-    phone_number = models.CharField(validators=[phone_regex], max_length=17)
+    phone_number = models.CharField(validators=[validate_phone], max_length=17)
     email = models.EmailField(blank=True, null=True)
     
     # Address
@@ -63,7 +117,7 @@ class Patient(models.Model):
     # Emergency Contact
     emergency_contact_name = models.CharField(max_length=200, blank=True)
     emergency_contact_phone = models.CharField(
-        validators=[phone_regex], 
+        validators=[validate_phone],
         max_length=17,
         blank=True
     )
@@ -103,18 +157,88 @@ class Patient(models.Model):
         verbose_name_plural = 'Patients'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['patient_id']),
+            # patient_id is unique=True, which already maintains a B-tree
             models.Index(fields=['phone_number']),
             models.Index(fields=['last_name', 'first_name']),
+            # Backs the default ordering and the ?after= seek cursor
+            models.Index(fields=['-created_at']),
+            # Partial index over the hot slice: active-patient counts and
+            # filters scan only live rows
+            models.Index(
+                fields=['is_active'],
+                name='patient_active_ix',
+                condition=models.Q(is_active=True),
+            ),
         ]
     
     def __str__(self):
         return f"{self.patient_id} - {self.get_full_name()}"
-    
+
+    def save(self, *args, **kwargs):
+        self.full_name = f"{self.first_name} {self.last_name}"
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and (
+            'first_name' in update_fields or 'last_name' in update_fields
+        ):
+            kwargs['update_fields'] = list(update_fields) + ['full_name']
+        if not self.patient_id:
+            # Mint the ID and insert in one transaction so two concurrent
+            # registrations cannot commit the same number; the UNIQUE
+            # constraint backstops the race
+            with transaction.atomic():
+                self.patient_id = self.generate_patient_id()
+                return super().save(*args, **kwargs)
+        return super().save(*args, **kwargs)
+
+    @classmethod
+    def search(cls, query, queryset=None):
+        """
+        Match patients against a free-text query. On Postgres (production)
+        this runs as one full-text search; elsewhere it falls back to the
+        ORed icontains filters.
+        """
+        from django.db import connection
+
+        qs = queryset if queryset is not None else cls.objects.all()
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+
+            vector = SearchVector(
+                'first_name', 'last_name', 'patient_id', 'phone_number', 'email'
+            )
+            return qs.annotate(search=vector).filter(search=SearchQuery(query))
+        return qs.filter(
+            models.Q(patient_id__icontains=query) |
+            models.Q(first_name__icontains=query) |
+            models.Q(last_name__icontains=query) |
+            models.Q(phone_number__icontains=query) |
+            models.Q(email__icontains=query)
+        )
+
+    @staticmethod
+    def generate_patient_id():
+        """Generate the next patient ID in the PAT sequence"""
+        # Parse and MAX() the numeric suffix in the database; one integer
+        # comes back over the wire
+        from django.db.models import IntegerField, Max
+        from django.db.models.functions import Cast, Substr
+
+        next_n = (
+            Patient.objects
+            .annotate(n=Cast(Substr('patient_id', 4), IntegerField()))
+            .aggregate(m=Max('n'))['m'] or 0
+        ) + 1
+        return f"PAT{next_n:05d}"
+
     def get_full_name(self):
-        return f"{self.first_name} {self.last_name}"
+        return self.full_name or f"{self.first_name} {self.last_name}"
     
     def get_age(self):
+        # Prefer the age annotation when the queryset supplied one (see
+        # PatientListView); fall back to Python date math
+        age = getattr(self, 'age', None)
+        if age is not None:
+            return int(age)
         today = date.today()
         return today.year - self.date_of_birth.year - (
             (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
@@ -148,9 +272,17 @@ class Queue(models.Model):
         ('urgent', 'Urgent'),
         ('emergency', 'Emergency'),
     )
-    
+    # Sorting the string priority alphabetically puts emergencies first by
+    # accident ('emergency' < 'normal' < 'urgent'); the rank makes the
+    # intended order explicit and cheap to index
+    PRIORITY_RANKS = {'emergency': 0, 'urgent': 1, 'normal': 2}
+
+
     # Queue Information
-    queue_number = models.CharField(max_length=15, unique=True)
+    # Nominal format is Q{YYYYMMDD}{n:03d} (12 chars), but :03d is a
+    # minimum width — leave headroom so a 1,000th daily entry doesn't
+    # overflow the column and hard-fail intake
+    queue_number = models.CharField(max_length=20, unique=True)
     patient = models.ForeignKey(
         Patient,
         on_delete=models.CASCADE,
@@ -163,7 +295,20 @@ class Queue(models.Model):
         null=True,
         blank=True
     )
-    
+    # Denormalized from Patient so admin search stays on this table;
+    # maintained by the signals at the bottom of this module
+    patient_full_name = models.CharField(
+        max_length=200,
+        blank=True,
+        editable=False,
+        db_index=True
+    )
+    doctor_full_name = models.CharField(
+        max_length=200,
+        blank=True,
+        editable=False
+    )
+
     # Queue Status
     status = models.CharField(
         max_length=20,
@@ -175,7 +320,11 @@ class Queue(models.Model):
         choices=PRIORITY_CHOICES,
         default='normal'
     )
-    
+    # Integer mirror of priority, maintained in save(); lets the default
+    # ordering come straight off an index with no filesort
+    priority_rank = models.PositiveSmallIntegerField(default=2, editable=False)
+
+
     # Timestamps
     arrival_time = models.DateTimeField(auto_now_add=True)
     called_time = models.DateTimeField(null=True, blank=True)
@@ -212,15 +361,37 @@ class Queue(models.Model):
         db_table = 'queue'
         verbose_name = 'Queue Entry'
         verbose_name_plural = 'Queue Entries'
-        ordering = ['priority', 'arrival_time']
+        ordering = ['priority_rank', 'arrival_time']
         indexes = [
-            models.Index(fields=['queue_date', 'status']),
+            # Leading queue_date keeps prefix lookups on (queue_date, status)
+            # covered while letting today's per-doctor dashboards scan one index
+            models.Index(fields=['queue_date', 'status', 'doctor']),
             models.Index(fields=['doctor', 'status']),
+            # The live board orders waiting/with-doctor rows; a partial
+            # index over just those statuses keeps that sort index-backed
+            models.Index(
+                fields=['queue_date', 'priority_rank', 'arrival_time'],
+                name='queue_live_order_ix',
+                condition=models.Q(status__in=['waiting', 'with_doctor'])
+            ),
+            # "Today's queue" in its display order, straight off the index
+            models.Index(
+                fields=['queue_date', 'priority_rank', 'arrival_time'],
+                name='queue_today_ordered_ix'
+            ),
         ]
     
     def __str__(self):
-        return f"Queue #{self.queue_number} - {self.patient.get_full_name()} ({self.get_status_display()})"
-    
+        name = self.patient_full_name or self.patient.get_full_name()
+        return f"Queue #{self.queue_number} - {name} ({self.get_status_display()})"
+
+    def save(self, *args, **kwargs):
+        self.priority_rank = self.PRIORITY_RANKS.get(self.priority, 2)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'priority' in update_fields:
+            kwargs['update_fields'] = list(update_fields) + ['priority_rank']
+        return super().save(*args, **kwargs)
+
     def get_wait_time(self):
         """Calculate actual wait time"""
         if self.consultation_start_time:
@@ -235,20 +406,34 @@ class Queue(models.Model):
         """Mark patient as with doctor"""
         self.status = 'with_doctor'
         self.consultation_start_time = timezone.now()
-        self.save()
-    
+        self.save(update_fields=['status', 'consultation_start_time', 'updated_at'])
+
     def mark_completed(self):
         """Mark queue entry as completed"""
         self.status = 'completed'
         self.consultation_end_time = timezone.now()
-        self.save()
-    
+        self.save(update_fields=['status', 'consultation_end_time', 'updated_at'])
+
+    @classmethod
+    def bulk_mark_no_show(cls, queue_ids):
+        """Mark a batch of queue entries as no-show in a single UPDATE"""
+        updated = cls.objects.filter(pk__in=queue_ids).update(
+            status='no_show', updated_at=timezone.now()
+        )
+        if updated:
+            # update() skips signals; roll the stats version by hand
+            bump_dashboard_version()
+        return updated
+
     @staticmethod
     def generate_queue_number():
         """Generate unique queue number for today"""
         today = date.today()
-        today_queues = Queue.objects.filter(queue_date=today).count()
-        return f"Q{today.strftime('%Y%m%d')}{today_queues + 1:03d}"
+        n = DailyCounter.next_value(
+            'queue', today,
+            seed=lambda: Queue.objects.filter(queue_date=today).count()
+        )
+        return f"Q{today.strftime('%Y%m%d')}{n:03d}"
 
 
 class Appointment(models.Model):
@@ -274,6 +459,8 @@ class Appointment(models.Model):
     )
     
     # Appointment Information
+    # APT{YYYYMMDD}{n:04d} is 15 chars nominally; kept wider because the
+    # counter format is a minimum width, not a cap
     appointment_id = models.CharField(
         max_length=20,
         unique=True,
@@ -289,7 +476,20 @@ class Appointment(models.Model):
         on_delete=models.CASCADE,
         related_name='appointments'
     )
-    
+    # Denormalized from Patient so admin search stays on this table;
+    # maintained by the signals at the bottom of this module
+    patient_full_name = models.CharField(
+        max_length=200,
+        blank=True,
+        editable=False,
+        db_index=True
+    )
+    doctor_full_name = models.CharField(
+        max_length=200,
+        blank=True,
+        editable=False
+    )
+
     # Scheduling
     appointment_date = models.DateField()
     appointment_time = models.TimeField()
@@ -373,13 +573,52 @@ class Appointment(models.Model):
         ordering = ['appointment_date', 'appointment_time']
         unique_together = ['doctor', 'appointment_date', 'appointment_time']
         indexes = [
-            models.Index(fields=['appointment_date', 'status']),
+            # appointment_time completes the day views' ORDER BY so the
+            # (date, status) filter and the sort come off one index
+            models.Index(fields=['appointment_date', 'status', 'appointment_time']),
             models.Index(fields=['patient', 'appointment_date']),
             models.Index(fields=['doctor', 'appointment_date']),
+            # Covers the slot-conflict exists() probe in the booking forms
+            models.Index(
+                fields=['doctor', 'appointment_date', 'appointment_time', 'status'],
+                name='appt_slot_idx'
+            ),
+            # Partial variant for the hot probes, which only ever look at
+            # active statuses; stays small as finished rows accumulate
+            models.Index(
+                fields=['doctor', 'appointment_date', 'appointment_time'],
+                name='appt_active_slot_idx',
+                condition=models.Q(status__in=['scheduled', 'confirmed', 'checked_in'])
+            ),
+            # Backs the list view's display order and its seek cursor
+            models.Index(
+                fields=['-appointment_date', '-appointment_time', '-id'],
+                name='appt_list_order_ix'
+            ),
+            # Day/calendar views only scan live appointments; keep their
+            # index clear of completed and cancelled history
+            models.Index(
+                fields=['appointment_date', 'appointment_time'],
+                name='appt_active_date_time_ix',
+                condition=models.Q(status__in=[
+                    'scheduled', 'confirmed', 'checked_in', 'in_progress'
+                ])
+            ),
         ]
     
     def __str__(self):
-        return f"{self.appointment_id} - {self.patient.get_full_name()} with Dr. {self.doctor.full_name} on {self.appointment_date}"
+        patient_name = self.patient_full_name or self.patient.get_full_name()
+        doctor_name = self.doctor_full_name or self.doctor.full_name
+        return f"{self.appointment_id} - {patient_name} with Dr. {doctor_name} on {self.appointment_date}"
+
+    def save(self, *args, **kwargs):
+        if not self.appointment_id:
+            # Mint the ID and insert together, same as Patient.save(); the
+            # UNIQUE constraint backstops concurrent bookings
+            with transaction.atomic():
+                self.appointment_id = self.generate_appointment_id()
+                return super().save(*args, **kwargs)
+        return super().save(*args, **kwargs)
     
     def get_end_time(self):
         """Calculate appointment end time"""
@@ -389,17 +628,17 @@ class Appointment(models.Model):
     
     def is_past(self):
         """Check if appointment is in the past"""
-        from django.utils import timezone
-        
+        # Prefer the past annotation when the queryset supplied one
+        # (see AppointmentListView)
+        past = getattr(self, 'past', None)
+        if past is not None:
+            return bool(past)
+
         appointment_datetime = datetime.combine(
-            self.appointment_date, 
-            self.appointment_time
+            self.appointment_date,
+            self.appointment_time,
+            tzinfo=_LOCAL_TZ,
         )
-        
-        # Make the datetime timezone-aware
-        if timezone.is_naive(appointment_datetime):
-            appointment_datetime = timezone.make_aware(appointment_datetime)
-        
         return appointment_datetime < timezone.now()
     
     def can_cancel(self):
@@ -415,25 +654,25 @@ class Appointment(models.Model):
         self.status = 'confirmed'
         self.is_confirmed = True
         self.confirmed_at = timezone.now()
-        self.save()
-    
+        self.save(update_fields=['status', 'is_confirmed', 'confirmed_at', 'updated_at'])
+
     def mark_checked_in(self):
         """Mark patient as checked in"""
         self.status = 'checked_in'
         self.checked_in_at = timezone.now()
-        self.save()
-    
+        self.save(update_fields=['status', 'checked_in_at', 'updated_at'])
+
     def start_consultation(self):
         """Start the consultation"""
         self.status = 'in_progress'
         self.consultation_start_time = timezone.now()
-        self.save()
-    
+        self.save(update_fields=['status', 'consultation_start_time', 'updated_at'])
+
     def complete_appointment(self):
         """Complete the appointment"""
         self.status = 'completed'
         self.consultation_end_time = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'consultation_end_time', 'updated_at'])
     
     def cancel_appointment(self, reason, cancelled_by=None):
         """Cancel the appointment"""
@@ -443,33 +682,35 @@ class Appointment(models.Model):
         self.cancelled_by = cancelled_by
         self.save()
     
+    @classmethod
+    def slot_taken(cls, doctor_id, appointment_date, appointment_time, exclude_pk=None):
+        """
+        Single shared conflict probe for the booking and reschedule forms;
+        rides the (doctor, date, time, status) composite index
+        """
+        qs = cls.objects.filter(
+            doctor_id=doctor_id,
+            appointment_date=appointment_date,
+            appointment_time=appointment_time,
+            status__in=('scheduled', 'confirmed', 'checked_in')
+        )
+        if exclude_pk is not None:
+            qs = qs.exclude(pk=exclude_pk)
+        # Keep the probe to SELECT 1 ... LIMIT 1 over the pk only
+        return qs.values('pk').exists()
+
     @staticmethod
     def generate_appointment_id():
         """Generate unique appointment ID"""
-        import random
-        import string
-        
         today = date.today()
         date_str = today.strftime('%Y%m%d')
-        
-        # Try to generate a unique ID with incrementing counter
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            # Count appointments created today
-            today_count = Appointment.objects.filter(
+        n = DailyCounter.next_value(
+            'appointment', today,
+            seed=lambda: Appointment.objects.filter(
                 appointment_id__startswith=f"APT{date_str}"
             ).count()
-            
-            # Generate ID with counter
-            appointment_id = f"APT{date_str}{today_count + 1:04d}"
-            
-            # Check if this ID already exists
-            if not Appointment.objects.filter(appointment_id=appointment_id).exists():
-                return appointment_id
-        
-        # Fallback: add random suffix if we somehow still have collision
-        random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
-        return f"APT{date_str}{random_suffix}"
+        )
+        return f"APT{date_str}{n:04d}"
 
 
 class DoctorAvailability(models.Model):
@@ -517,6 +758,11 @@ class DoctorAvailability(models.Model):
     
     def get_booked_slots(self):
         """Get count of booked appointments for this slot"""
+        # Prefer the booked_count annotation when the queryset supplied one
+        # (see DoctorAvailabilityListView); fall back to a per-row COUNT
+        booked = getattr(self, 'booked_count', None)
+        if booked is not None:
+            return booked
         return Appointment.objects.filter(
             doctor=self.doctor,
             appointment_date=self.date,
@@ -534,26 +780,189 @@ class DoctorAvailability(models.Model):
     def get_available_time_slots(self, slot_duration=30):
         """Generate available time slots"""
         from datetime import datetime, timedelta
-        
+
+        # On Postgres let generate_series enumerate the slots and check
+        # bookings against them in the same query
+        from django.db import connection
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT s::time AS slot,
+                           NOT EXISTS (
+                               SELECT 1 FROM appointment a
+                               WHERE a.doctor_id = %s
+                                 AND a.appointment_date = %s
+                                 AND a.appointment_time = s::time
+                                 AND a.status IN ('scheduled', 'confirmed', 'checked_in')
+                           ) AS available
+                    FROM generate_series(
+                        %s::date + %s::time,
+                        %s::date + %s::time - interval '1 minute',
+                        make_interval(mins => %s)
+                    ) s
+                    """,
+                    [self.doctor_id, self.date,
+                     self.date, self.start_time,
+                     self.date, self.end_time,
+                     slot_duration],
+                )
+                return [
+                    {'time': slot, 'available': available}
+                    for slot, available in cursor.fetchall()
+                ]
+
+        # SQLite fallback: one query for every booked time in the window;
+        # the loop then checks set membership instead of exists() per slot
+        booked = set(
+            Appointment.objects.filter(
+                doctor=self.doctor,
+                appointment_date=self.date,
+                appointment_time__gte=self.start_time,
+                appointment_time__lt=self.end_time,
+                status__in=['scheduled', 'confirmed', 'checked_in']
+            ).values_list('appointment_time', flat=True)
+        )
+
         slots = []
         current_time = datetime.combine(date.today(), self.start_time)
         end_time = datetime.combine(date.today(), self.end_time)
-        
+
         while current_time < end_time:
-            # Check if this specific time slot is available
             slot_time = current_time.time()
-            is_booked = Appointment.objects.filter(
-                doctor=self.doctor,
-                appointment_date=self.date,
-                appointment_time=slot_time,
-                status__in=['scheduled', 'confirmed', 'checked_in']
-            ).exists()
-            
             slots.append({
                 'time': slot_time,
-                'available': not is_booked
+                'available': slot_time not in booked
             })
-            
             current_time += timedelta(minutes=slot_duration)
-        
-        return slots
\ No newline at end of file
+
+        return slots
+
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+
+def waiting_count_key(doctor_id, queue_date):
+    return f'qwait:{doctor_id}:{queue_date:%Y%m%d}'
+
+
+def get_waiting_count(doctor_id, queue_date):
+    """
+    Cached count of waiting queue entries for one doctor/day. Queue writes
+    invalidate the key (signal below), so bursts of check-ins read the
+    counter instead of re-running COUNT() per insert.
+    """
+    key = waiting_count_key(doctor_id, queue_date)
+    count = cache.get(key)
+    if count is None:
+        count = Queue.objects.filter(
+            doctor_id=doctor_id,
+            status='waiting',
+            queue_date=queue_date
+        ).count()
+        cache.set(key, count, 60 * 60 * 24)
+    return count
+
+
+def dashboard_version():
+    """
+    Monotonic token for the dashboard stats; bumped on every appointment
+    or queue write so versioned cache keys roll over instead of serving
+    stale counts for a full TTL
+    """
+    return cache.get_or_set('dashboard_ver', 0, None)
+
+
+def bump_dashboard_version():
+    try:
+        cache.incr('dashboard_ver')
+    except ValueError:
+        cache.set('dashboard_ver', 1, None)
+
+
+def doctor_total_count():
+    """
+    Cached head-count of doctors; it changes a few times a year, so the
+    dashboards read it for an hour at a time and a Doctor write drops
+    the key (signal below).
+    """
+    return cache.get_or_set('doctor_total', Doctor.objects.count, 60 * 60)
+
+
+def active_patient_count():
+    """
+    O(1) read of the active-patient total. Patient writes drop the key
+    (signal below); recomputes hit only patient_active_ix, so the
+    dashboards stop scanning the patient table on every poll.
+    """
+    return cache.get_or_set(
+        'active_patient_total',
+        lambda: Patient.objects.filter(is_active=True).count(),
+        60 * 60 * 24,
+    )
+
+
+@receiver(pre_save, sender=Queue, dispatch_uid='frontdesk.queue_patient_name')
+@receiver(pre_save, sender=Appointment, dispatch_uid='frontdesk.appt_patient_name')
+def denormalize_patient_name(sender, instance, **kwargs):
+    """Copy the patient's and doctor's names onto the row for joinless reads"""
+    if instance.patient_id:
+        instance.patient_full_name = instance.patient.get_full_name()
+    if instance.doctor_id:
+        instance.doctor_full_name = instance.doctor.full_name
+
+
+@receiver(post_save, sender=Patient, dispatch_uid='frontdesk.patient_rename')
+def propagate_patient_rename(sender, instance, **kwargs):
+    """Keep the denormalized names in sync after a patient edit"""
+    name = instance.get_full_name()
+    for model in (Queue, Appointment):
+        model.objects.filter(patient=instance).exclude(
+            patient_full_name=name
+        ).update(patient_full_name=name)
+
+
+@receiver(post_save, sender=Doctor, dispatch_uid='frontdesk.doctor_rename')
+def propagate_doctor_rename(sender, instance, **kwargs):
+    """Keep the denormalized doctor names in sync after a doctor edit"""
+    for model in (Queue, Appointment):
+        model.objects.filter(doctor=instance).exclude(
+            doctor_full_name=instance.full_name
+        ).update(doctor_full_name=instance.full_name)
+
+
+@receiver(post_save, sender=Patient, dispatch_uid='frontdesk.patient_cache_save')
+@receiver(post_delete, sender=Patient, dispatch_uid='frontdesk.patient_cache_delete')
+def invalidate_patient_caches(sender, **kwargs):
+    """Drop cached patient lookups (form choice list, dashboard total)"""
+    cache.delete_many(['active_patient_choices', 'active_patient_total'])
+
+
+@receiver(post_save, sender=Doctor, dispatch_uid='frontdesk.doctor_cache_save')
+@receiver(post_delete, sender=Doctor, dispatch_uid='frontdesk.doctor_cache_delete')
+def invalidate_doctor_caches(sender, **kwargs):
+    """Drop the cached doctor head-count whenever a doctor row changes"""
+    cache.delete('doctor_total')
+
+
+@receiver(post_save, sender=Queue, dispatch_uid='frontdesk.queue_count_save')
+@receiver(post_delete, sender=Queue, dispatch_uid='frontdesk.queue_count_delete')
+def invalidate_waiting_counts(sender, instance, **kwargs):
+    """Drop the cached waiting count whenever a queue entry changes"""
+    if instance.doctor_id:
+        cache.delete(waiting_count_key(instance.doctor_id, instance.queue_date))
+
+
+@receiver(post_save, sender=Queue, dispatch_uid='frontdesk.dash_ver_queue_save')
+@receiver(post_delete, sender=Queue, dispatch_uid='frontdesk.dash_ver_queue_delete')
+@receiver(post_save, sender=Appointment, dispatch_uid='frontdesk.dash_ver_appt_save')
+@receiver(post_delete, sender=Appointment, dispatch_uid='frontdesk.dash_ver_appt_delete')
+@receiver(post_save, sender=Patient, dispatch_uid='frontdesk.dash_ver_patient_save')
+@receiver(post_delete, sender=Patient, dispatch_uid='frontdesk.dash_ver_patient_delete')
+@receiver(post_save, sender=Doctor, dispatch_uid='frontdesk.dash_ver_doctor_save')
+@receiver(post_delete, sender=Doctor, dispatch_uid='frontdesk.dash_ver_doctor_delete')
+def bump_dashboard_version_on_write(sender, **kwargs):
+    """Roll the dashboard stats version forward on every relevant write"""
+    bump_dashboard_version()
\ No newline at end of file
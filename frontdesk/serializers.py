@@ -10,21 +10,47 @@ class PatientSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class PatientMiniSerializer(serializers.ModelSerializer):
+    """
+    Lean nested representation for queue/appointment rows; skips the
+    address and medical TextFields the full serializer drags along
+    """
+    class Meta:
+        model = Patient
+        fields = ['id', 'patient_id', 'first_name', 'last_name',
+                  'phone_number', 'date_of_birth', 'gender']
+        read_only_fields = ['id']
+
+
 class QueueSerializer(serializers.ModelSerializer):
-    patient = PatientSerializer(read_only=True)
+    patient = PatientMiniSerializer(read_only=True)
     doctor = DoctorSerializer(read_only=True)
-    
+
     class Meta:
         model = Queue
         fields = '__all__'
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the nested rows so list serialization avoids N+1 queries"""
+        return queryset.select_related(
+            'patient', 'doctor', 'doctor__user', 'added_by'
+        )
+
 
 class AppointmentSerializer(serializers.ModelSerializer):
-    patient = PatientSerializer(read_only=True)
+    patient = PatientMiniSerializer(read_only=True)
     doctor = DoctorSerializer(read_only=True)
-    
+
     class Meta:
         model = Appointment
         fields = '__all__'
         read_only_fields = ['id', 'created_at', 'updated_at']
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the nested rows so list serialization avoids N+1 queries"""
+        return queryset.select_related(
+            'patient', 'doctor', 'doctor__user', 'scheduled_by'
+        )
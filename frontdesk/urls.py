@@ -1,4 +1,7 @@
 from django.urls import path
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+
 from . import views
 
 app_name = 'frontdesk'
@@ -42,8 +45,16 @@ urlpatterns = [
     # AJAX endpoints
     path('api/patients/search/', views.search_patients_ajax, name='search_patients_ajax'),
     path('api/appointments/available-slots/', views.get_available_slots_ajax, name='available_slots_ajax'),
-    path('api/queue/stats/', views.queue_stats_ajax, name='queue_stats_ajax'),
-    path('api/dashboard/stats/', views.dashboard_stats_ajax, name='dashboard_stats_ajax'),
+    # Polled by dashboards; a 15s shared cache absorbs the polling burst
+    # (vary_on_cookie keeps entries per-session)
+    path('api/queue/stats/',
+         cache_page(15)(vary_on_cookie(views.queue_stats_ajax)),
+         name='queue_stats_ajax'),
+    # dashboard_stats_ajax caches in-view with write-versioned keys, so
+    # no cache_page here — a page cache would pin stale counts for its
+    # whole TTL after a write
+    path('api/dashboard/stats/', views.dashboard_stats_ajax,
+         name='dashboard_stats_ajax'),
 
     # Visit History URLs
     path('visits/history/', views.patient_visit_history_view, name='visit_history'),
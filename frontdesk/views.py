@@ -1,17 +1,21 @@
 # frontdesk/views.py
 
-from .models import Patient, Queue, Appointment, DoctorAvailability
+from .models import (
+    Patient, Queue, Appointment, DoctorAvailability, active_patient_count,
+    bump_dashboard_version, dashboard_version, doctor_total_count,
+    waiting_count_key
+)
 from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
-from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.urls import reverse_lazy
-from django.http import JsonResponse
-from django.db.models import Q, Count
+from django.http import HttpResponse, JsonResponse
+from django.core.cache import cache
+from django.db.models import Q, Count, F, Prefetch
 from django.utils import timezone
 from datetime import date, datetime, timedelta
-from accounts.models import Doctor, FrontDeskStaff
+from accounts.models import Doctor, FrontDeskStaff, drop_doctor_caches
+from accounts.mixins import StaffRequiredMixin, staff_required
 from .forms import (
     PatientForm, QueueForm, QueueStatusUpdateForm, AppointmentForm,
     AppointmentRescheduleForm, AppointmentCancelForm, DoctorAvailabilityForm,
@@ -19,58 +23,108 @@ from .forms import (
 )
 
 
-# Helper function to check if user is staff
-def is_staff_user(user):
-    return user.is_authenticated and user.user_type == 'staff'
+# Valid status keys, built once at import instead of per request
+_QUEUE_STATUS_KEYS = frozenset(key for key, _ in Queue.STATUS_CHOICES)
+
+
+class KeysetPaginationMixin:
+    """
+    Cursor ("seek") pagination for list views. Fetches page_size + 1 rows
+    to learn whether a next page exists — no COUNT, no OFFSET — and hands
+    the templates a next_cursor plus the current filter querystring for
+    the First/Next links. Subclasses apply the cursor in get_queryset and
+    define cursor_for(row) to serialize the last row's position.
+    """
+    page_size = 20
+
+    def cursor_for(self, row):
+        raise NotImplementedError
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        rows = list(context['object_list'][:self.page_size + 1])
+        has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        context['object_list'] = rows
+        context[self.context_object_name] = rows
+        if has_next:
+            context['next_cursor'] = self.cursor_for(rows[-1])
+
+        # Current filters without the cursor, for rebuilding page links
+        params = self.request.GET.copy()
+        params.pop('after', None)
+        params.pop('page', None)
+        context['filter_params'] = params.urlencode()
+        return context
 
 
 # Dashboard View
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def dashboard_view(request):
     """
     Main dashboard for front desk staff
     """
     today = date.today()
+
+    def compute_stats():
+        # Today's statistics: one filtered-Count aggregate per table
+        # instead of seven separate COUNT round-trips
+        appointment_stats = Appointment.objects.filter(
+            appointment_date=today
+        ).aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status__in=['scheduled', 'confirmed'])),
+            completed=Count('id', filter=Q(status='completed')),
+        )
+        queue_stats = Queue.objects.filter(queue_date=today).aggregate(
+            waiting=Count('id', filter=Q(status='waiting')),
+            with_doctor=Count('id', filter=Q(status='with_doctor')),
+        )
+        return {
+            'total_appointments_today': appointment_stats['total'],
+            'pending_appointments': appointment_stats['pending'],
+            'completed_appointments': appointment_stats['completed'],
+            'total_in_queue': queue_stats['waiting'],
+            'patients_with_doctor': queue_stats['with_doctor'],
+            # Cached exact count, invalidated on patient writes, so the
+            # ever-growing patient table is never scanned per poll
+            'total_patients': active_patient_count(),
+            'available_doctors': Doctor.objects.filter(is_available=True).count(),
+        }
+
+    # Every staff member lands here; a short shared cache means only one
+    # request per 30s window actually runs the aggregates
+    stats = cache.get_or_set(f'dashstats:{today.isoformat()}', compute_stats, 30)
     
-    # Get today's statistics
-    today_appointments = Appointment.objects.filter(appointment_date=today)
-    today_queue = Queue.objects.filter(queue_date=today)
-    
-    stats = {
-        'total_appointments_today': today_appointments.count(),
-        'pending_appointments': today_appointments.filter(
-            status__in=['scheduled', 'confirmed']
-        ).count(),
-        'completed_appointments': today_appointments.filter(status='completed').count(),
-        'total_in_queue': today_queue.filter(status='waiting').count(),
-        'patients_with_doctor': today_queue.filter(status='with_doctor').count(),
-        'total_patients': Patient.objects.filter(is_active=True).count(),
-        'available_doctors': Doctor.objects.filter(is_available=True).count(),
-    }
-    
+    # The three panels read the denormalized name columns, so each list
+    # is a narrow single-table scan with no patient/doctor joins
+    appointment_columns = (
+        'id', 'appointment_date', 'appointment_time', 'status',
+        'appointment_type', 'patient_full_name', 'doctor_full_name',
+    )
+
     # Recent appointments
-    recent_appointments = Appointment.objects.select_related(
-        'patient', 'doctor'
-    ).filter(
+    recent_appointments = Appointment.objects.filter(
         appointment_date=today
-    ).order_by('appointment_time')[:5]
-    
+    ).only(*appointment_columns).order_by('appointment_time')[:5]
+
     # Current queue
-    current_queue = Queue.objects.select_related(
-        'patient', 'doctor'
-    ).filter(
+    current_queue = Queue.objects.filter(
         queue_date=today,
         status__in=['waiting', 'with_doctor']
-    ).order_by('priority', 'arrival_time')[:10]
-    
+    ).only(
+        'id', 'queue_number', 'status', 'priority', 'priority_rank',
+        'arrival_time', 'patient_full_name'
+    ).order_by('priority_rank', 'arrival_time')[:10]
+
     # Upcoming appointments (next 3 days)
-    upcoming_appointments = Appointment.objects.select_related(
-        'patient', 'doctor'
-    ).filter(
+    upcoming_appointments = Appointment.objects.filter(
         appointment_date__range=[today, today + timedelta(days=3)],
         status__in=['scheduled', 'confirmed']
-    ).order_by('appointment_date', 'appointment_time')[:10]
+    ).only(*appointment_columns).order_by(
+        'appointment_date', 'appointment_time'
+    )[:10]
     
     context = {
         'title': 'Dashboard',
@@ -84,32 +138,59 @@ def dashboard_view(request):
 
 
 # Patient Management Views
-class PatientListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
+class PatientListView(StaffRequiredMixin, KeysetPaginationMixin, ListView):
     """
     List all patients
     """
     model = Patient
     template_name = 'frontdesk/patient_list.html'
     context_object_name = 'patients'
-    paginate_by = 20
-    
-    def test_func(self):
-        return is_staff_user(self.request.user)
-    
+
+    def cursor_for(self, row):
+        return row.created_at.isoformat()
+
+
     def get_queryset(self):
-        queryset = Patient.objects.filter(is_active=True).order_by('-created_at')
-        
-        # Search functionality
+        # Fetch only what the table renders; the medical/address text
+        # blocks stay out of the per-row SELECT
+        queryset = Patient.objects.filter(is_active=True).only(
+            'id', 'patient_id', 'first_name', 'last_name', 'full_name',
+            'phone_number', 'email', 'gender', 'date_of_birth',
+            'registration_date', 'created_at'
+        ).order_by('-created_at')
+
+        # On Postgres compute the age column in the page query so
+        # get_age() stops doing per-row Python date math
+        from django.db import connection
+        if connection.vendor == 'postgresql':
+            from django.db.models.expressions import RawSQL
+            queryset = queryset.annotate(
+                age=RawSQL("date_part('year', age(date_of_birth))", [])
+            )
+
+        # Search functionality; full-text on Postgres, LIKE fallback on
+        # SQLite (see Patient.search)
         search_query = self.request.GET.get('search', '')
         if search_query:
-            queryset = queryset.filter(
-                Q(patient_id__icontains=search_query) |
-                Q(first_name__icontains=search_query) |
-                Q(last_name__icontains=search_query) |
-                Q(phone_number__icontains=search_query) |
-                Q(email__icontains=search_query)
-            )
-        
+            queryset = Patient.search(search_query, queryset)
+
+        # Keyset ("seek") pagination: ?after= carries the last row's
+        # created_at so deep pages seek on the index instead of making
+        # OFFSET scan and discard every earlier row
+        after = self.request.GET.get('after', '')
+        if after:
+            from django.utils.dateparse import parse_datetime
+            try:
+                # parse_datetime raises for well-formed but impossible
+                # values (month 13 etc.); treat those as no cursor too
+                cursor = parse_datetime(after)
+            except ValueError:
+                cursor = None
+            if cursor is not None:
+                if timezone.is_naive(cursor):
+                    cursor = timezone.make_aware(cursor)
+                queryset = queryset.filter(created_at__lt=cursor)
+
         return queryset
     
     def get_context_data(self, **kwargs):
@@ -119,7 +200,7 @@ class PatientListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
         return context
 
 
-class PatientCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+class PatientCreateView(StaffRequiredMixin, CreateView):
     """
     Add new patient
     """
@@ -128,8 +209,6 @@ class PatientCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
     template_name = 'frontdesk/patient_form.html'
     success_url = reverse_lazy('frontdesk:patient_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         patient = form.save(commit=False)
@@ -153,7 +232,7 @@ class PatientCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         return context
 
 
-class PatientUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class PatientUpdateView(StaffRequiredMixin, UpdateView):
     """
     Update patient information
     """
@@ -162,8 +241,6 @@ class PatientUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     template_name = 'frontdesk/patient_form.html'
     success_url = reverse_lazy('frontdesk:patient_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         messages.success(self.request, f'Patient {form.instance.get_full_name()} updated successfully!')
@@ -176,7 +253,7 @@ class PatientUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         return context
 
 
-class PatientDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class PatientDeleteView(StaffRequiredMixin, DeleteView):
     """
     Soft delete patient (set is_active to False)
     """
@@ -184,8 +261,6 @@ class PatientDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     template_name = 'frontdesk/patient_confirm_delete.html'
     success_url = reverse_lazy('frontdesk:patient_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def delete(self, request, *args, **kwargs):
         self.object = self.get_object()
@@ -195,16 +270,33 @@ class PatientDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return redirect(self.success_url)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def patient_detail_view(request, pk):
     """
     View patient details with appointments and queue history
     """
-    patient = get_object_or_404(Patient, pk=pk)
-    appointments = Appointment.objects.filter(patient=patient).order_by('-appointment_date')[:10]
-    queue_history = Queue.objects.filter(patient=patient).order_by('-queue_date')[:10]
-    
+    # Prefetch the visit history with the doctor joined in, so the template
+    # renders without one query per appointment/queue row
+    patient = get_object_or_404(
+        Patient.objects.prefetch_related(
+            Prefetch(
+                'appointments',
+                queryset=Appointment.objects.select_related('doctor')
+                .order_by('-appointment_date')[:10],
+                to_attr='recent_appointments'
+            ),
+            Prefetch(
+                'queue_entries',
+                queryset=Queue.objects.select_related('doctor')
+                .order_by('-queue_date')[:10],
+                to_attr='recent_queue_entries'
+            ),
+        ),
+        pk=pk
+    )
+    appointments = patient.recent_appointments
+    queue_history = patient.recent_queue_entries
+
     context = {
         'title': f'Patient - {patient.get_full_name()}',
         'patient': patient,
@@ -216,8 +308,7 @@ def patient_detail_view(request, pk):
 
 
 # Queue Management Views
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def queue_management_view(request):
     """
     Queue management page
@@ -225,15 +316,16 @@ def queue_management_view(request):
     today = date.today()
     queue_entries = Queue.objects.filter(
         queue_date=today
-    ).select_related('patient', 'doctor').order_by('priority', 'arrival_time')
+    ).select_related('patient', 'doctor').order_by('priority_rank', 'arrival_time')
     
-    # Queue statistics
-    stats = {
-        'waiting': queue_entries.filter(status='waiting').count(),
-        'with_doctor': queue_entries.filter(status='with_doctor').count(),
-        'completed': queue_entries.filter(status='completed').count(),
-        'total': queue_entries.count(),
-    }
+    # Queue statistics in one filtered-Count aggregate instead of four
+    # COUNT round-trips over the same rows
+    stats = Queue.objects.filter(queue_date=today).aggregate(
+        waiting=Count('id', filter=Q(status='waiting')),
+        with_doctor=Count('id', filter=Q(status='with_doctor')),
+        completed=Count('id', filter=Q(status='completed')),
+        total=Count('id'),
+    )
     
     context = {
         'title': 'Queue Management',
@@ -245,8 +337,7 @@ def queue_management_view(request):
     return render(request, 'frontdesk/queue_management.html', context)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def add_to_queue_view(request):
     """
     Add patient to queue
@@ -280,39 +371,55 @@ def add_to_queue_view(request):
     return render(request, 'frontdesk/queue_add.html', context)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def update_queue_status_view(request, pk):
     """
     Update queue entry status
     """
-    queue_entry = get_object_or_404(Queue, pk=pk)
+    queue_entry = get_object_or_404(
+        Queue.objects.select_related('patient', 'doctor'), pk=pk
+    )
     
     if request.method == 'POST':
         new_status = request.POST.get('status')
         
-        if new_status in dict(Queue.STATUS_CHOICES):
+        if new_status in _QUEUE_STATUS_KEYS:
             old_status = queue_entry.status
             queue_entry.status = new_status
             
             # Update timestamps based on status
             if new_status == 'with_doctor':
                 queue_entry.mark_with_doctor()
-                # Mark doctor as busy
+                # Mark doctor as busy with a single-column UPDATE instead
+                # of rewriting the whole Doctor row
                 if queue_entry.doctor:
-                    queue_entry.doctor.is_available = False
-                    queue_entry.doctor.save()
+                    Doctor.objects.filter(pk=queue_entry.doctor_id).update(
+                        is_available=False, updated_at=timezone.now()
+                    )
+                    # update() skips signals; drop the cached form choices
+                    drop_doctor_caches()
                     messages.info(request, f'Dr. {queue_entry.doctor.full_name} is now marked as Busy')
-                    
+
             elif new_status == 'completed':
                 queue_entry.mark_completed()
                 # Mark doctor as available again
                 if queue_entry.doctor:
-                    queue_entry.doctor.is_available = True
-                    queue_entry.doctor.save()
+                    Doctor.objects.filter(pk=queue_entry.doctor_id).update(
+                        is_available=True, updated_at=timezone.now()
+                    )
+                    drop_doctor_caches()
                     messages.success(request, f'Dr. {queue_entry.doctor.full_name} is now Available')
             else:
-                queue_entry.save()
+                Queue.objects.filter(pk=queue_entry.pk).update(
+                    status=new_status, updated_at=timezone.now()
+                )
+                # update() skips signals, so drop the waiting-count cache
+                # and roll the stats version ourselves
+                if queue_entry.doctor_id:
+                    cache.delete(waiting_count_key(
+                        queue_entry.doctor_id, queue_entry.queue_date
+                    ))
+                bump_dashboard_version()
             
             messages.success(request, f'Queue status updated to {queue_entry.get_status_display()}')
         else:
@@ -321,13 +428,14 @@ def update_queue_status_view(request, pk):
     return redirect('frontdesk:queue_management')
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def remove_from_queue_view(request, pk):
     """
     Remove/cancel queue entry
     """
-    queue_entry = get_object_or_404(Queue, pk=pk)
+    queue_entry = get_object_or_404(
+        Queue.objects.select_related('patient', 'doctor'), pk=pk
+    )
     
     if request.method == 'POST':
         queue_entry.status = 'cancelled'
@@ -337,51 +445,90 @@ def remove_from_queue_view(request, pk):
     return redirect('frontdesk:queue_management')
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def today_queue_view(request):
     """
     View today's queue (AJAX-friendly)
     """
     today = date.today()
-    queue_entries = Queue.objects.filter(
-        queue_date=today,
-        status__in=['waiting', 'with_doctor']
-    ).select_related('patient', 'doctor').order_by('priority', 'arrival_time')
-    
+
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        # values() rows straight to JSON: no model instantiation, no
+        # joins — the denormalized name columns carry the display names
+        rows = Queue.objects.filter(
+            queue_date=today,
+            status__in=['waiting', 'with_doctor']
+        ).values(
+            'id', 'queue_number', 'patient_full_name', 'doctor_full_name',
+            'status', 'priority', 'arrival_time', 'consultation_start_time'
+        ).order_by('priority_rank', 'arrival_time')
+
+        status_labels = dict(Queue.STATUS_CHOICES)
+        priority_labels = dict(Queue.PRIORITY_CHOICES)
+        now = timezone.now()
+
+        def wait_minutes(row):
+            if row['consultation_start_time']:
+                delta = row['consultation_start_time'] - row['arrival_time']
+            elif row['status'] == 'waiting':
+                delta = now - row['arrival_time']
+            else:
+                return 0
+            return int(delta.total_seconds() / 60)
+
         data = [{
-            'id': q.id,
-            'queue_number': q.queue_number,
-            'patient_name': q.patient.get_full_name(),
-            'doctor_name': q.doctor.full_name if q.doctor else 'Not Assigned',
-            'status': q.get_status_display(),
-            'priority': q.get_priority_display(),
-            'wait_time': q.get_wait_time(),
-        } for q in queue_entries]
+            'id': row['id'],
+            'queue_number': row['queue_number'],
+            'patient_name': row['patient_full_name'],
+            'doctor_name': row['doctor_full_name'] or 'Not Assigned',
+            'status': status_labels[row['status']],
+            'priority': priority_labels[row['priority']],
+            'wait_time': wait_minutes(row),
+        } for row in rows]
         return JsonResponse(data, safe=False)
-    
+
     return redirect('frontdesk:queue_management')
 
 
 # Appointment Management Views
-class AppointmentListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
+class AppointmentListView(StaffRequiredMixin, KeysetPaginationMixin, ListView):
     """
     List all appointments
     """
     model = Appointment
     template_name = 'frontdesk/appointment_list.html'
     context_object_name = 'appointments'
-    paginate_by = 20
-    
-    def test_func(self):
-        return is_staff_user(self.request.user)
-    
+
+    def cursor_for(self, row):
+        return f"{row.appointment_date}_{row.appointment_time}_{row.pk}"
+
+
     def get_queryset(self):
+        from django.db.models import BooleanField, ExpressionWrapper
+
+        # Decide "is this appointment past?" in the page query; the
+        # can_cancel/can_reschedule template checks then skip per-row
+        # datetime construction in is_past()
+        now = timezone.localtime()
         queryset = Appointment.objects.select_related(
             'patient', 'doctor'
-        ).all().order_by('-appointment_date', '-appointment_time')
-        
+        ).only(
+            'id', 'appointment_id', 'appointment_date', 'appointment_time',
+            'status', 'appointment_type',
+            'patient__patient_id', 'patient__first_name',
+            'patient__last_name', 'patient__full_name',
+            'doctor__full_name',
+        ).annotate(
+            past=ExpressionWrapper(
+                Q(appointment_date__lt=now.date())
+                | Q(appointment_date=now.date(), appointment_time__lt=now.time()),
+                output_field=BooleanField(),
+            )
+        ).order_by(
+            # id breaks ties so the seek cursor never skips or repeats rows
+            '-appointment_date', '-appointment_time', '-id'
+        )
+
         # Filter by status
         status = self.request.GET.get('status', '')
         if status:
@@ -401,17 +548,70 @@ class AppointmentListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
         if doctor_id:
             queryset = queryset.filter(doctor_id=doctor_id)
         
-        # Search
+        # Search on this table's denormalized patient name; trigram-ranked
+        # on Postgres (GIN index in migration 0017), LIKE fallback on SQLite
         search_query = self.request.GET.get('search', '')
         if search_query:
-            queryset = queryset.filter(
-                Q(appointment_id__icontains=search_query) |
-                Q(patient__first_name__icontains=search_query) |
-                Q(patient__last_name__icontains=search_query) |
-                Q(patient__patient_id__icontains=search_query)
-            )
-        
+            from django.db import connection
+            if connection.vendor == 'postgresql':
+                from django.contrib.postgres.search import TrigramSimilarity
+
+                queryset = queryset.annotate(
+                    sim=TrigramSimilarity('patient_full_name', search_query)
+                ).filter(
+                    Q(sim__gt=0.1)
+                    | Q(appointment_id__istartswith=search_query)
+                    | Q(patient__patient_id__istartswith=search_query)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(appointment_id__icontains=search_query) |
+                    Q(patient_full_name__icontains=search_query) |
+                    Q(patient__patient_id__icontains=search_query)
+                )
+
+        # Keyset ("seek") pagination: ?after= carries the last row's
+        # position — either a bare date or the full <date>_<time>_<id>
+        # tuple — so deep pages seek on the index instead of paying for
+        # a growing OFFSET
+        after = self.request.GET.get('after', '')
+        if after:
+            queryset = self._seek_after(queryset, after)
+
         return queryset
+
+    @staticmethod
+    def _seek_after(queryset, after):
+        from django.utils.dateparse import parse_date, parse_time
+
+        parts = after.split('_')
+        try:
+            # parse_date raises for well-formed but impossible values
+            # (month 13 etc.); an unusable cursor means the first page
+            cursor_date = parse_date(parts[0])
+        except ValueError:
+            cursor_date = None
+        if cursor_date is None:
+            return queryset
+        if len(parts) >= 3:
+            try:
+                cursor_time = parse_time(parts[1])
+            except ValueError:
+                cursor_time = None
+            try:
+                cursor_id = int(parts[2])
+            except ValueError:
+                cursor_id = None
+            if cursor_time is not None and cursor_id is not None:
+                return queryset.filter(
+                    Q(appointment_date__lt=cursor_date)
+                    | Q(appointment_date=cursor_date,
+                        appointment_time__lt=cursor_time)
+                    | Q(appointment_date=cursor_date,
+                        appointment_time=cursor_time,
+                        id__lt=cursor_id)
+                )
+        return queryset.filter(appointment_date__lt=cursor_date)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -422,7 +622,7 @@ class AppointmentListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
         return context
 
 
-class AppointmentCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+class AppointmentCreateView(StaffRequiredMixin, CreateView):
     """
     Schedule new appointment
     """
@@ -431,18 +631,12 @@ class AppointmentCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView)
     template_name = 'frontdesk/appointment_form.html'
     success_url = reverse_lazy('frontdesk:appointment_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         try:
             staff_profile = FrontDeskStaff.objects.get(user=self.request.user)
             appointment = form.save(commit=False)
-            
-            # Generate appointment ID before saving
-            if not appointment.appointment_id:
-                appointment.appointment_id = Appointment.generate_appointment_id()
-            
+            # Appointment.save() mints the ID when it is blank
             appointment.scheduled_by = staff_profile
             appointment.save()
             
@@ -465,7 +659,7 @@ class AppointmentCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView)
         return context
 
 
-class AppointmentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class AppointmentUpdateView(StaffRequiredMixin, UpdateView):
     """
     Update appointment details
     """
@@ -474,8 +668,6 @@ class AppointmentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView)
     template_name = 'frontdesk/appointment_form.html'
     success_url = reverse_lazy('frontdesk:appointment_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def get_form(self, form_class=None):
         form = super().get_form(form_class)
@@ -500,8 +692,7 @@ class AppointmentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView)
         return context
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def appointment_detail_view(request, pk):
     """
     View appointment details
@@ -516,13 +707,14 @@ def appointment_detail_view(request, pk):
     return render(request, 'frontdesk/appointment_detail.html', context)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def cancel_appointment_view(request, pk):
     """
     Cancel an appointment
     """
-    appointment = get_object_or_404(Appointment, pk=pk)
+    appointment = get_object_or_404(
+        Appointment.objects.select_related('patient', 'doctor'), pk=pk
+    )
     
     if not appointment.can_cancel():
         messages.error(request, 'This appointment cannot be cancelled.')
@@ -553,13 +745,14 @@ def cancel_appointment_view(request, pk):
     return render(request, 'frontdesk/appointment_cancel.html', context)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def reschedule_appointment_view(request, pk):
     """
     Reschedule an appointment
     """
-    appointment = get_object_or_404(Appointment, pk=pk)
+    appointment = get_object_or_404(
+        Appointment.objects.select_related('patient', 'doctor'), pk=pk
+    )
     
     if not appointment.can_reschedule():
         messages.error(request, 'This appointment cannot be rescheduled.')
@@ -568,27 +761,36 @@ def reschedule_appointment_view(request, pk):
     if request.method == 'POST':
         form = AppointmentRescheduleForm(request.POST, appointment=appointment)
         if form.is_valid():
-            # Create new appointment
-            new_appointment = Appointment.objects.create(
-                patient=appointment.patient,
-                doctor=appointment.doctor,
-                appointment_date=form.cleaned_data['new_date'],
-                appointment_time=form.cleaned_data['new_time'],
-                duration=appointment.duration,
-                appointment_type=appointment.appointment_type,
-                reason_for_visit=appointment.reason_for_visit,
-                symptoms=appointment.symptoms,
-                special_instructions=appointment.special_instructions,
-                scheduled_by=appointment.scheduled_by,
-                rescheduled_from=appointment
-            )
-            new_appointment.appointment_id = Appointment.generate_appointment_id()
-            new_appointment.save()
-            
-            # Mark old appointment as rescheduled
-            appointment.status = 'rescheduled'
-            appointment.notes = f"Rescheduled to {new_appointment.appointment_date} {new_appointment.appointment_time}. Reason: {form.cleaned_data.get('reason', 'Not specified')}"
-            appointment.save()
+            # Copy + retire as one transaction: FK ids instead of joined
+            # objects, and the old row is closed with a targeted UPDATE,
+            # so both statements commit or neither does
+            from django.db import transaction
+
+            with transaction.atomic():
+                new_appointment = Appointment.objects.create(
+                    patient_id=appointment.patient_id,
+                    doctor_id=appointment.doctor_id,
+                    appointment_date=form.cleaned_data['new_date'],
+                    appointment_time=form.cleaned_data['new_time'],
+                    duration=appointment.duration,
+                    appointment_type=appointment.appointment_type,
+                    reason_for_visit=appointment.reason_for_visit,
+                    symptoms=appointment.symptoms,
+                    special_instructions=appointment.special_instructions,
+                    scheduled_by_id=appointment.scheduled_by_id,
+                    rescheduled_from=appointment
+                )
+
+                # Mark old appointment as rescheduled
+                Appointment.objects.filter(pk=appointment.pk).update(
+                    status='rescheduled',
+                    notes=(
+                        f"Rescheduled to {new_appointment.appointment_date} "
+                        f"{new_appointment.appointment_time}. Reason: "
+                        f"{form.cleaned_data.get('reason', 'Not specified')}"
+                    ),
+                    updated_at=timezone.now(),
+                )
             
             messages.success(
                 request,
@@ -607,59 +809,75 @@ def reschedule_appointment_view(request, pk):
     return render(request, 'frontdesk/appointment_reschedule.html', context)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def confirm_appointment_view(request, pk):
     """
     Confirm an appointment
     """
-    appointment = get_object_or_404(Appointment, pk=pk)
-    
-    if appointment.status == 'scheduled':
-        appointment.mark_confirmed()
-        messages.success(request, f'Appointment {appointment.appointment_id} confirmed.')
+    # Conditional UPDATE: the status guard rides along in the WHERE
+    # clause, so no full-row fetch and no lost update under concurrency
+    now = timezone.now()
+    updated = Appointment.objects.filter(pk=pk, status='scheduled').update(
+        status='confirmed', is_confirmed=True, confirmed_at=now, updated_at=now
+    )
+
+    if updated:
+        bump_dashboard_version()
+        appointment_id = Appointment.objects.values_list(
+            'appointment_id', flat=True
+        ).get(pk=pk)
+        messages.success(request, f'Appointment {appointment_id} confirmed.')
     else:
         messages.warning(request, 'Appointment is already confirmed or cannot be confirmed.')
-    
+
     return redirect('frontdesk:appointment_detail', pk=pk)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def checkin_appointment_view(request, pk):
     """
     Check-in patient for appointment
     """
-    appointment = get_object_or_404(Appointment, pk=pk)
-    
-    if appointment.status in ['scheduled', 'confirmed']:
-        appointment.mark_checked_in()
-        messages.success(request, f'Patient {appointment.patient.get_full_name()} checked in.')
+    now = timezone.now()
+    updated = Appointment.objects.filter(
+        pk=pk, status__in=['scheduled', 'confirmed']
+    ).update(status='checked_in', checked_in_at=now, updated_at=now)
+
+    if updated:
+        bump_dashboard_version()
+        patient_name = Appointment.objects.values_list(
+            'patient_full_name', flat=True
+        ).get(pk=pk)
+        messages.success(request, f'Patient {patient_name} checked in.')
     else:
         messages.warning(request, 'Cannot check in this appointment.')
-    
+
     return redirect('frontdesk:appointment_detail', pk=pk)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def complete_appointment_view(request, pk):
     """
     Mark appointment as completed
     """
-    appointment = get_object_or_404(Appointment, pk=pk)
-    
-    if appointment.status in ['checked_in', 'in_progress']:
-        appointment.complete_appointment()
-        messages.success(request, f'Appointment {appointment.appointment_id} marked as completed.')
+    now = timezone.now()
+    updated = Appointment.objects.filter(
+        pk=pk, status__in=['checked_in', 'in_progress']
+    ).update(status='completed', consultation_end_time=now, updated_at=now)
+
+    if updated:
+        bump_dashboard_version()
+        appointment_id = Appointment.objects.values_list(
+            'appointment_id', flat=True
+        ).get(pk=pk)
+        messages.success(request, f'Appointment {appointment_id} marked as completed.')
     else:
         messages.warning(request, 'Cannot complete this appointment.')
-    
+
     return redirect('frontdesk:appointment_detail', pk=pk)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def appointment_calendar_view(request):
     """
     Calendar view of appointments
@@ -668,15 +886,39 @@ def appointment_calendar_view(request):
     month = int(request.GET.get('month', datetime.now().month))
     year = int(request.GET.get('year', datetime.now().year))
     
-    # Get all appointments for the month
-    appointments = Appointment.objects.filter(
-        appointment_date__year=year,
-        appointment_date__month=month
-    ).select_related('patient', 'doctor')
-    
+    def build_month():
+        # values() rows instead of model instances — the template only
+        # reads plain columns, and the denormalized names mean no joins
+        month_appointments = Appointment.objects.filter(
+            appointment_date__year=year,
+            appointment_date__month=month
+        )
+        rows = list(month_appointments.values(
+            'pk', 'appointment_date', 'appointment_time', 'status',
+            'patient_full_name', 'doctor_full_name'
+        ).order_by(
+            'appointment_date', 'appointment_time'
+        ).iterator(chunk_size=500))
+
+        # Per-day histogram for the calendar grid in one GROUP BY instead
+        # of a query per day
+        counts = list(month_appointments.values('appointment_date').annotate(
+            total=Count('id'),
+            confirmed=Count('id', filter=Q(status='confirmed')),
+            cancelled=Count('id', filter=Q(status='cancelled')),
+        ).order_by('appointment_date'))
+        return rows, counts
+
+    # Whole months rarely change between clicks; a short shared cache
+    # absorbs back-and-forth navigation
+    appointments, day_counts = cache.get_or_set(
+        f'cal:{year:04d}-{month:02d}', build_month, 60
+    )
+
     context = {
         'title': 'Appointment Calendar',
         'appointments': appointments,
+        'day_counts': day_counts,
         'current_month': month,
         'current_year': year,
     }
@@ -685,7 +927,7 @@ def appointment_calendar_view(request):
 
 
 # Doctor Availability Management
-class DoctorAvailabilityListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
+class DoctorAvailabilityListView(StaffRequiredMixin, ListView):
     """
     List doctor availability
     """
@@ -694,12 +936,24 @@ class DoctorAvailabilityListView(LoginRequiredMixin, UserPassesTestMixin, ListVi
     context_object_name = 'availabilities'
     paginate_by = 20
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def get_queryset(self):
+        # Count booked appointments per row in the list query itself so the
+        # template's get_booked_slots calls stop issuing one COUNT() each
         queryset = DoctorAvailability.objects.select_related('doctor').filter(
             date__gte=date.today()
+        ).annotate(
+            booked_count=Count(
+                'doctor__appointments',
+                filter=Q(
+                    doctor__appointments__appointment_date=F('date'),
+                    doctor__appointments__appointment_time__gte=F('start_time'),
+                    doctor__appointments__appointment_time__lt=F('end_time'),
+                    doctor__appointments__status__in=[
+                        'scheduled', 'confirmed', 'checked_in'
+                    ],
+                )
+            )
         ).order_by('date', 'start_time')
         
         # Filter by doctor
@@ -716,7 +970,7 @@ class DoctorAvailabilityListView(LoginRequiredMixin, UserPassesTestMixin, ListVi
         return context
 
 
-class DoctorAvailabilityCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+class DoctorAvailabilityCreateView(StaffRequiredMixin, CreateView):
     """
     Create doctor availability slot
     """
@@ -725,8 +979,6 @@ class DoctorAvailabilityCreateView(LoginRequiredMixin, UserPassesTestMixin, Crea
     template_name = 'frontdesk/availability_form.html'
     success_url = reverse_lazy('frontdesk:availability_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         messages.success(self.request, 'Doctor availability added successfully!')
@@ -739,7 +991,7 @@ class DoctorAvailabilityCreateView(LoginRequiredMixin, UserPassesTestMixin, Crea
         return context
 
 
-class DoctorAvailabilityUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class DoctorAvailabilityUpdateView(StaffRequiredMixin, UpdateView):
     """
     Update doctor availability
     """
@@ -748,8 +1000,6 @@ class DoctorAvailabilityUpdateView(LoginRequiredMixin, UserPassesTestMixin, Upda
     template_name = 'frontdesk/availability_form.html'
     success_url = reverse_lazy('frontdesk:availability_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def form_valid(self, form):
         messages.success(self.request, 'Doctor availability updated successfully!')
@@ -762,7 +1012,7 @@ class DoctorAvailabilityUpdateView(LoginRequiredMixin, UserPassesTestMixin, Upda
         return context
 
 
-class DoctorAvailabilityDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class DoctorAvailabilityDeleteView(StaffRequiredMixin, DeleteView):
     """
     Delete doctor availability
     """
@@ -770,8 +1020,6 @@ class DoctorAvailabilityDeleteView(LoginRequiredMixin, UserPassesTestMixin, Dele
     template_name = 'frontdesk/availability_confirm_delete.html'
     success_url = reverse_lazy('frontdesk:availability_list')
     
-    def test_func(self):
-        return is_staff_user(self.request.user)
     
     def delete(self, request, *args, **kwargs):
         messages.success(request, 'Doctor availability deleted successfully!')
@@ -779,38 +1027,65 @@ class DoctorAvailabilityDeleteView(LoginRequiredMixin, UserPassesTestMixin, Dele
 
 
 # AJAX Views
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def search_patients_ajax(request):
     """
     AJAX search for patients
     """
     query = request.GET.get('q', '')
-    
+
     if len(query) < 2:
         return JsonResponse([], safe=False)
-    
-    patients = Patient.objects.filter(
-        Q(patient_id__icontains=query) |
-        Q(first_name__icontains=query) |
-        Q(last_name__icontains=query) |
-        Q(phone_number__icontains=query),
-        is_active=True
-    )[:10]
-    
-    results = [{
-        'id': patient.id,
-        'patient_id': patient.patient_id,
-        'name': patient.get_full_name(),
-        'phone': patient.phone_number,
-        'age': patient.get_age(),
-    } for patient in patients]
-    
+
+    def run_search():
+        base = Patient.objects.filter(is_active=True)
+
+        # On Postgres rank by trigram similarity against the denormalized
+        # full_name column (GIN-indexed in migration 0012) instead of
+        # ORing four unindexed icontains scans
+        from django.db import connection
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import TrigramSimilarity
+
+            patients = base.annotate(
+                sim=TrigramSimilarity('full_name', query)
+            ).filter(
+                Q(sim__gt=0.1)
+                | Q(patient_id__istartswith=query)
+                | Q(phone_number__startswith=query)
+            ).order_by('-sim')
+        else:
+            patients = base.filter(
+                Q(patient_id__icontains=query) |
+                Q(first_name__icontains=query) |
+                Q(last_name__icontains=query) |
+                Q(phone_number__icontains=query)
+            )
+
+        # values() dicts straight to JSON — no Patient instantiation; age
+        # is the same birthday-aware arithmetic as get_age()
+        today = date.today()
+        return [{
+            'id': row['id'],
+            'patient_id': row['patient_id'],
+            'name': row['full_name'],
+            'phone': row['phone_number'],
+            'age': today.year - row['date_of_birth'].year - (
+                (today.month, today.day)
+                < (row['date_of_birth'].month, row['date_of_birth'].day)
+            ),
+        } for row in patients.values(
+            'id', 'patient_id', 'full_name', 'phone_number', 'date_of_birth'
+        )[:10]]
+
+    # Typeahead fires the same prefix from many keystrokes and staff
+    # members; a short shared cache answers the repeats without SQL
+    results = cache.get_or_set(f'psearch:{query.lower()}', run_search, 15)
+
     return JsonResponse(results, safe=False)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def get_available_slots_ajax(request):
     """
     Get available time slots for a doctor on a specific date
@@ -823,13 +1098,14 @@ def get_available_slots_ajax(request):
     
     try:
         appointment_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-        doctor = Doctor.objects.get(id=doctor_id)
-    except (ValueError, Doctor.DoesNotExist):
+        doctor_id = int(doctor_id)
+    except ValueError:
         return JsonResponse({'error': 'Invalid doctor or date'}, status=400)
-    
-    # Get doctor availability for the date
+
+    # Get doctor availability for the date; filtering on doctor_id skips
+    # the separate Doctor existence SELECT
     availability = DoctorAvailability.objects.filter(
-        doctor=doctor,
+        doctor_id=doctor_id,
         date=appointment_date,
         is_available=True
     ).first()
@@ -848,74 +1124,153 @@ def get_available_slots_ajax(request):
     })
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def queue_stats_ajax(request):
     """
     Get real-time queue statistics
     """
+    from django.db.models import Avg, DurationField, ExpressionWrapper
+
     today = date.today()
-    queue_entries = Queue.objects.filter(queue_date=today)
-    
-    stats = {
-        'waiting': queue_entries.filter(status='waiting').count(),
-        'with_doctor': queue_entries.filter(status='with_doctor').count(),
-        'completed': queue_entries.filter(status='completed').count(),
-        'cancelled': queue_entries.filter(status='cancelled').count(),
-        'total': queue_entries.count(),
-        'avg_wait_time': 0,
-    }
-    
-    # Calculate average wait time
-    completed_entries = queue_entries.filter(status='completed')
-    if completed_entries.exists():
-        total_wait = sum([entry.get_wait_time() for entry in completed_entries])
-        stats['avg_wait_time'] = round(total_wait / completed_entries.count(), 2)
-    
+
+    # One aggregate round trip for every number on the board, including
+    # the average wait, instead of five COUNTs plus a Python loop
+    stats = Queue.objects.filter(queue_date=today).aggregate(
+        waiting=Count('id', filter=Q(status='waiting')),
+        with_doctor=Count('id', filter=Q(status='with_doctor')),
+        completed=Count('id', filter=Q(status='completed')),
+        cancelled=Count('id', filter=Q(status='cancelled')),
+        total=Count('id'),
+        avg_wait=Avg(
+            ExpressionWrapper(
+                F('consultation_start_time') - F('arrival_time'),
+                output_field=DurationField(),
+            ),
+            filter=Q(status='completed', consultation_start_time__isnull=False),
+        ),
+    )
+
+    avg_wait = stats.pop('avg_wait')
+    stats['avg_wait_time'] = (
+        round(avg_wait.total_seconds() / 60, 2) if avg_wait else 0
+    )
+
     return JsonResponse(stats)
 
 
-@login_required
-@user_passes_test(is_staff_user)
-def dashboard_stats_ajax(request):
+def _compute_dashboard_stats(today):
     """
-    Get dashboard statistics (for real-time updates)
+    All dashboard numbers. On Postgres a single statement of FILTERed
+    aggregates covers every table in one round trip; elsewhere it falls
+    back to one aggregate() per table.
     """
-    today = date.today()
-    
-    appointments_today = Appointment.objects.filter(appointment_date=today)
-    queue_today = Queue.objects.filter(queue_date=today)
-    
-    stats = {
-        'appointments': {
-            'total': appointments_today.count(),
-            'scheduled': appointments_today.filter(status='scheduled').count(),
-            'confirmed': appointments_today.filter(status='confirmed').count(),
-            'checked_in': appointments_today.filter(status='checked_in').count(),
-            'completed': appointments_today.filter(status='completed').count(),
-            'cancelled': appointments_today.filter(status='cancelled').count(),
-        },
-        'queue': {
-            'waiting': queue_today.filter(status='waiting').count(),
-            'with_doctor': queue_today.filter(status='with_doctor').count(),
-            'completed': queue_today.filter(status='completed').count(),
-        },
+    from django.db import connection
+
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT a.total, a.scheduled, a.confirmed, a.checked_in,
+                       a.completed, a.cancelled,
+                       q.waiting, q.with_doctor, q.completed,
+                       d.available
+                FROM (
+                    SELECT COUNT(*) AS total,
+                           COUNT(*) FILTER (WHERE status = 'scheduled') AS scheduled,
+                           COUNT(*) FILTER (WHERE status = 'confirmed') AS confirmed,
+                           COUNT(*) FILTER (WHERE status = 'checked_in') AS checked_in,
+                           COUNT(*) FILTER (WHERE status = 'completed') AS completed,
+                           COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled
+                    FROM appointment WHERE appointment_date = %s
+                ) a, (
+                    SELECT COUNT(*) FILTER (WHERE status = 'waiting') AS waiting,
+                           COUNT(*) FILTER (WHERE status = 'with_doctor') AS with_doctor,
+                           COUNT(*) FILTER (WHERE status = 'completed') AS completed
+                    FROM queue WHERE queue_date = %s
+                ) q, (
+                    SELECT COUNT(*) FILTER (WHERE is_available) AS available
+                    FROM doctor
+                ) d
+                """,
+                [today, today],
+            )
+            row = cursor.fetchone()
+        return {
+            'appointments': dict(zip(
+                ('total', 'scheduled', 'confirmed', 'checked_in',
+                 'completed', 'cancelled'),
+                row[:6],
+            )),
+            'queue': dict(zip(('waiting', 'with_doctor', 'completed'), row[6:9])),
+            'doctors': {
+                'available': row[9],
+                'total': doctor_total_count(),
+            },
+            'patients': {
+                'total': active_patient_count(),
+            },
+        }
+
+    return {
+        'appointments': Appointment.objects.filter(
+            appointment_date=today
+        ).aggregate(
+            total=Count('id'),
+            scheduled=Count('id', filter=Q(status='scheduled')),
+            confirmed=Count('id', filter=Q(status='confirmed')),
+            checked_in=Count('id', filter=Q(status='checked_in')),
+            completed=Count('id', filter=Q(status='completed')),
+            cancelled=Count('id', filter=Q(status='cancelled')),
+        ),
+        'queue': Queue.objects.filter(queue_date=today).aggregate(
+            waiting=Count('id', filter=Q(status='waiting')),
+            with_doctor=Count('id', filter=Q(status='with_doctor')),
+            completed=Count('id', filter=Q(status='completed')),
+        ),
         'doctors': {
             'available': Doctor.objects.filter(is_available=True).count(),
-            'total': Doctor.objects.count(),
+            # Slow-moving cardinality; cached for an hour and dropped by
+            # the Doctor write signal
+            'total': doctor_total_count(),
         },
         'patients': {
-            'total': Patient.objects.filter(is_active=True).count(),
-        }
+            'total': active_patient_count(),
+        },
     }
-    
-    return JsonResponse(stats)
+
+
+@staff_required
+def dashboard_stats_ajax(request):
+    """
+    Get dashboard statistics (for real-time updates)
+    """
+    today = date.today()
+
+    # The write version doubles as an ETag: idle-period polls send it
+    # back and get an empty 304 without touching the aggregates at all
+    ver = dashboard_version()
+    etag = f'"{today.isoformat()}-{ver}"'
+    if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        return HttpResponse(status=304)
+
+    # Every poller shares one cached copy per write-version; the version
+    # (bumped by model signals) rolls the key over right after a write,
+    # and the short TTL bounds staleness from writes that bypass signals
+    # (bulk update() paths)
+    stats = cache.get_or_set(
+        f'dashstats_ajax:{today.isoformat()}:{ver}',
+        lambda: _compute_dashboard_stats(today),
+        10,
+    )
+
+    response = JsonResponse(stats)
+    response['ETag'] = etag
+    return response
 
 
 # Patients History Details Code 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def patient_visit_history_view(request):
     """
     View all patients who have been checked by doctors (completed visits)
@@ -1039,8 +1394,7 @@ def patient_visit_history_view(request):
     return render(request, 'frontdesk/visit_history.html', context)
 
 
-@login_required
-@user_passes_test(is_staff_user)
+@staff_required
 def visit_detail_view(request, visit_type, pk):
     """
     View detailed information about a specific visit (queue or appointment)